@@ -286,8 +286,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     apply_debug_logging(debug_enabled)
 
     # Register WebSocket API commands for dashboard
-    from .websocket import async_register_websocket_commands
+    from .websocket import (
+        async_register_websocket_commands,
+        async_track_dashboard_updates,
+    )
     async_register_websocket_commands(hass)
+    entry.async_on_unload(async_track_dashboard_updates(hass, entry))
 
     # Register frontend panel in sidebar
     from .frontend import async_register_frontend
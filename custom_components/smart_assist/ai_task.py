@@ -193,6 +193,7 @@ class SmartAssistAITask(AITaskEntity):
         hass.data[DOMAIN][config_entry.entry_id]["tasks"][subentry.subentry_id] = {
             "llm_client": self._llm_client,
             "entity": self,
+            "get_tool_names": self.get_registered_tool_names,
         }
 
         self._last_tool_call_records: list[ToolCallRecord] = []
@@ -15,7 +15,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
@@ -84,13 +84,30 @@ class MemoryManager:
         self._store: Store = Store(hass, MEMORY_STORAGE_VERSION, MEMORY_STORAGE_KEY)
         self._data: dict[str, Any] = _empty_store_data()
         self._dirty = False
+        self._revision = 0
         self._last_save: float = 0.0
         self._save_debounce_seconds = 30.0
         self._pending_save_handle: asyncio.TimerHandle | None = None
+        # Explicit saves (dashboard edits) are coalesced over a short window
+        self._force_save_window_seconds = 0.2
+        self._pending_force_save_handle: asyncio.TimerHandle | None = None
+        self._pending_force_save: asyncio.Future[None] | None = None
+        self._pending_force_save_task: asyncio.Task[None] | None = None
+
+    @property
+    def revision(self) -> int:
+        """Return a counter that changes whenever the memory store changes."""
+        return self._revision
+
+    def _mark_dirty(self) -> None:
+        """Flag memory data for saving and bump the store revision."""
+        self._dirty = True
+        self._revision += 1
 
     async def async_load(self) -> None:
         """Load memory from storage. Call once at startup."""
         stored = await self._store.async_load()
+        self._revision += 1
         if stored is not None:
             self._data = stored
             # Ensure structure integrity
@@ -135,8 +152,37 @@ class MemoryManager:
             await self._force_save()
 
     async def async_force_save(self) -> None:
-        """Public wrapper to persist memory immediately."""
-        await self._force_save()
+        """Persist memory, sharing one write between calls in a short window.
+
+        Bursts of edits (e.g. deleting several memories from the dashboard)
+        result in a single storage write; every caller returns once it is done.
+        """
+        if self._pending_force_save is None:
+            self._pending_force_save = self._hass.loop.create_future()
+            self._pending_force_save_handle = self._hass.loop.call_later(
+                self._force_save_window_seconds, self._start_coalesced_force_save
+            )
+        await asyncio.shield(self._pending_force_save)
+
+    @callback
+    def _start_coalesced_force_save(self) -> None:
+        """Start the shared save once the coalescing window has elapsed."""
+        self._pending_force_save_handle = None
+        self._pending_force_save_task = self._hass.async_create_task(
+            self._coalesced_force_save()
+        )
+
+    async def _coalesced_force_save(self) -> None:
+        """Run the shared save and release everyone waiting on it."""
+        future = self._pending_force_save
+        self._pending_force_save_handle = None
+        self._pending_force_save = None
+        try:
+            await self._force_save()
+        finally:
+            self._pending_force_save_task = None
+            if future is not None and not future.done():
+                future.set_result(None)
 
     async def _force_save(self) -> None:
         """Force save memory to storage immediately."""
@@ -156,6 +202,13 @@ class MemoryManager:
         if self._pending_save_handle is not None:
             self._pending_save_handle.cancel()
             self._pending_save_handle = None
+        if self._pending_force_save_handle is not None:
+            self._pending_force_save_handle.cancel()
+            await self._coalesced_force_save()
+        elif self._pending_force_save_task is not None:
+            # The window elapsed but the shared save has not finished; let it
+            # complete instead of writing a second time.
+            await self._pending_force_save_task
         if self._dirty:
             await self._force_save()
 
@@ -164,7 +217,7 @@ class MemoryManager:
         if user_id not in self._data["users"]:
             display_name = user_id.capitalize() if user_id != "default" else None
             self._data["users"][user_id] = _empty_user_data(display_name)
-            self._dirty = True
+            self._mark_dirty()
             _LOGGER.debug("Created user profile: %s", user_id)
         return self._data["users"][user_id]
 
@@ -241,7 +294,7 @@ class MemoryManager:
             "source": source,
         }
         target_list.append(entry)
-        self._dirty = True
+        self._mark_dirty()
 
         scope_label = "global" if scope == "global" else f"user:{user_id}"
         _LOGGER.debug("Added memory %s (%s) [%s]", memory_id, category, scope_label)
@@ -263,7 +316,7 @@ class MemoryManager:
 
         memory["content"] = content
         memory["updated_at"] = dt_util.now().isoformat()
-        self._dirty = True
+        self._mark_dirty()
         return f"Updated memory {memory_id}"
 
     def delete_memory(self, user_id: str, memory_id: str) -> str:
@@ -273,7 +326,7 @@ class MemoryManager:
         for i, mem in enumerate(user_data["memories"]):
             if mem["id"] == memory_id:
                 user_data["memories"].pop(i)
-                self._dirty = True
+                self._mark_dirty()
                 return f"Deleted memory {memory_id}"
 
         # Check agent memories
@@ -281,14 +334,14 @@ class MemoryManager:
         for i, mem in enumerate(agent_data["memories"]):
             if mem["id"] == memory_id:
                 agent_data["memories"].pop(i)
-                self._dirty = True
+                self._mark_dirty()
                 return f"Deleted agent memory {memory_id}"
 
         # Check global memories
         for i, mem in enumerate(self._data["global_memories"]):
             if mem["id"] == memory_id:
                 self._data["global_memories"].pop(i)
-                self._dirty = True
+                self._mark_dirty()
                 return f"Deleted global memory {memory_id}"
 
         return f"Memory not found: {memory_id}"
@@ -431,7 +484,7 @@ class MemoryManager:
             for mem in selected:
                 mem["access_count"] = int(mem.get("access_count", 0)) + 1
                 mem["last_accessed"] = now_iso
-            self._dirty = True
+            self._mark_dirty()
 
         # Group by category for readability
         groups: dict[str, list[str]] = {}
@@ -575,7 +628,7 @@ class MemoryManager:
 
         old_name = self._data["users"][user_id].get("display_name", user_id)
         self._data["users"][user_id]["display_name"] = new_display_name
-        self._dirty = True
+        self._mark_dirty()
         _LOGGER.info("Renamed user %s: '%s' -> '%s'", user_id, old_name, new_display_name)
         return f"Renamed '{old_name}' to '{new_display_name}'"
 
@@ -637,7 +690,7 @@ class MemoryManager:
 
         # Delete source user
         del self._data["users"][source_user_id]
-        self._dirty = True
+        self._mark_dirty()
 
         source_name = source.get("display_name", source_user_id)
         target_name = target.get("display_name", target_user_id)
@@ -660,7 +713,7 @@ class MemoryManager:
         if not stats.get("first_interaction"):
             from homeassistant.util import dt as dt_util
             stats["first_interaction"] = dt_util.now().isoformat()
-        self._dirty = True
+        self._mark_dirty()
 
     # =========================================================================
     # Internal helpers
@@ -740,7 +793,7 @@ class MemoryManager:
 
         if len(kept) < before_count:
             agent_data["memories"] = kept
-            self._dirty = True
+            self._mark_dirty()
             _LOGGER.info(
                 "Agent memory cleanup: expired %d memories (kept %d)",
                 before_count - len(kept), len(kept),
@@ -91,10 +91,23 @@ class PersistentAlarmManager:
 
         self._data: dict[str, Any] = _empty_store_data()
         self._dirty = False
+        self._revision = 0
+        # active_only -> (revision, sorted alarm references) for list_alarms
+        self._sorted_views: dict[bool, tuple[int, list[dict[str, Any]]]] = {}
         self._last_save: float = 0.0
         self._save_debounce_seconds = 5.0
         self._pending_save_handle: asyncio.TimerHandle | None = None
 
+    @property
+    def revision(self) -> int:
+        """Return a counter that changes whenever the alarm store changes."""
+        return self._revision
+
+    def _mark_dirty(self) -> None:
+        """Flag alarm data for saving and bump the store revision."""
+        self._dirty = True
+        self._revision += 1
+
     async def _async_migrate_storage(
         self,
         old_major_version: int,
@@ -245,21 +258,26 @@ class PersistentAlarmManager:
         }
 
         self._data.setdefault("alarms", []).append(alarm)
-        self._dirty = True
+        self._mark_dirty()
         return dict(alarm), "Alarm created"
 
     def list_alarms(self, active_only: bool = True) -> list[dict[str, Any]]:
         """Return sorted alarm list."""
-        alarms = list(self._data.get("alarms", []))
-        if active_only:
-            alarms = [alarm for alarm in alarms if alarm.get("active") is True]
-
-        def _sort_key(alarm: dict[str, Any]) -> tuple[int, str]:
-            next_trigger = alarm.get("snoozed_until") or alarm.get("scheduled_for") or ""
-            return (0 if alarm.get("active") else 1, str(next_trigger))
-
-        alarms.sort(key=_sort_key)
-        return [dict(alarm) for alarm in alarms]
+        cached = self._sorted_views.get(active_only)
+        if cached is None or cached[0] != self._revision:
+            alarms = list(self._data.get("alarms", []))
+            if active_only:
+                alarms = [alarm for alarm in alarms if alarm.get("active") is True]
+
+            def _sort_key(alarm: dict[str, Any]) -> tuple[int, str]:
+                next_trigger = alarm.get("snoozed_until") or alarm.get("scheduled_for") or ""
+                return (0 if alarm.get("active") else 1, str(next_trigger))
+
+            alarms.sort(key=_sort_key)
+            # Every mutation bumps the revision, so the sorted order stays valid until then.
+            cached = (self._revision, alarms)
+            self._sorted_views[active_only] = cached
+        return [dict(alarm) for alarm in cached[1]]
 
     def get_alarm(self, alarm_id: str) -> dict[str, Any] | None:
         """Return a copy of alarm by id."""
@@ -276,7 +294,7 @@ class PersistentAlarmManager:
         alarm["dismissed"] = True
         alarm["status"] = "dismissed"
         alarm["updated_at"] = dt_util.now().isoformat()
-        self._dirty = True
+        self._mark_dirty()
         return True
 
     def delete_alarm(self, alarm_id: str) -> bool:
@@ -294,7 +312,7 @@ class PersistentAlarmManager:
             display_id_value = self._normalize_lookup_value(str(alarm.get("display_id") or ""))
             if target in {alarm_id_value, display_id_value}:
                 del alarms[index]
-                self._dirty = True
+                self._mark_dirty()
                 return True
 
         return False
@@ -323,7 +341,7 @@ class PersistentAlarmManager:
         alarm["fired"] = False
         alarm["status"] = "snoozed"
         alarm["updated_at"] = dt_util.now().isoformat()
-        self._dirty = True
+        self._mark_dirty()
         return dict(alarm), "Alarm snoozed"
 
     def get_recent_fired_alarms(
@@ -401,7 +419,7 @@ class PersistentAlarmManager:
                 due.append(fired_occurrence)
 
         if due:
-            self._dirty = True
+            self._mark_dirty()
 
         return due
 
@@ -491,6 +509,7 @@ class PersistentAlarmManager:
             "alarms": normalized,
         }
         self._dirty = False
+        self._revision += 1
 
     def update_alarm(
         self,
@@ -588,7 +607,7 @@ class PersistentAlarmManager:
             return dict(alarm), "No changes"
 
         alarm["updated_at"] = dt_util.now().isoformat()
-        self._dirty = True
+        self._mark_dirty()
         return dict(alarm), "Alarm updated"
 
     def export_state(self) -> dict[str, Any]:
@@ -636,7 +655,7 @@ class PersistentAlarmManager:
         direct["last_fire_marker"] = fire_marker
 
         alarm["updated_at"] = dt_util.now().isoformat()
-        self._dirty = True
+        self._mark_dirty()
         return True
 
     def _find_alarm(self, alarm_id: str) -> dict[str, Any] | None:
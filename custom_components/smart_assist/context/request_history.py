@@ -326,9 +326,11 @@ class RequestHistoryStore:
         if agent_id:
             filtered = [e for e in filtered if e.get("agent_id") == agent_id]
         total = len(filtered)
-        # Newest first
-        filtered = list(reversed(filtered))
-        return filtered[offset : offset + limit], total
+        # Newest first: slice the requested page from the end, then reverse only it
+        end = total - offset
+        if end <= 0:
+            return [], total
+        return filtered[max(end - limit, 0) : end][::-1], total
 
     def get_tool_analytics(
         self, agent_id: str | None = None
@@ -255,6 +255,7 @@ class SmartAssistConversationEntity(ConversationEntity):
         entry_data["agents"][subentry.subentry_id] = {
             "llm_client": self._llm_client,
             "entity": self,
+            "get_tool_names": self.get_registered_tool_names,
         }
         self._last_tts_engine_entity_id: str | None = None
         self._last_tts_voice: str | None = None
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 import logging
 import re
 from typing import Any, Final, TYPE_CHECKING
@@ -73,6 +74,9 @@ SMART_ASSIST_LOGGERS: Final = (
     "custom_components.smart_assist.sensor",
 )
 
+# Logger objects are resolved once; toggling only needs setLevel()
+_CACHED_LOGGERS: Final = tuple(logging.getLogger(name) for name in SMART_ASSIST_LOGGERS)
+
 
 def apply_debug_logging(enabled: bool) -> None:
     """Apply debug logging setting to all Smart Assist loggers.
@@ -82,27 +86,34 @@ def apply_debug_logging(enabled: bool) -> None:
     """
     level = logging.DEBUG if enabled else logging.INFO
     
-    for logger_name in SMART_ASSIST_LOGGERS:
-        logging.getLogger(logger_name).setLevel(level)
+    for logger in _CACHED_LOGGERS:
+        logger.setLevel(level)
     
     _LOGGER.info("Smart Assist debug logging %s", "enabled" if enabled else "disabled")
 
-# Emoji pattern - covers most common emoji ranges
-EMOJI_PATTERN: Final = re.compile(
-    "["
-    "\U0001F600-\U0001F64F"  # emoticons
-    "\U0001F300-\U0001F5FF"  # symbols & pictographs
-    "\U0001F680-\U0001F6FF"  # transport & map symbols
-    "\U0001F1E0-\U0001F1FF"  # flags
-    "\U00002702-\U000027B0"  # dingbats
-    "\U0001F900-\U0001F9FF"  # supplemental symbols
-    "\U0001FA00-\U0001FA6F"  # chess symbols
-    "\U0001FA70-\U0001FAFF"  # symbols & pictographs extended-A
-    "\U00002600-\U000026FF"  # misc symbols
-    "\U00002300-\U000023FF"  # misc technical
-    "]+",
-    flags=re.UNICODE,
-)
+
+@lru_cache(maxsize=None)
+def _get_emoji_pattern() -> re.Pattern[str]:
+    """Compile the emoji pattern on first use.
+
+    Covers most common emoji ranges. The character class materializes a
+    large range table, so it is only built once TTS cleanup actually runs.
+    """
+    return re.compile(
+        "["
+        "\U0001F600-\U0001F64F"  # emoticons
+        "\U0001F300-\U0001F5FF"  # symbols & pictographs
+        "\U0001F680-\U0001F6FF"  # transport & map symbols
+        "\U0001F1E0-\U0001F1FF"  # flags
+        "\U00002702-\U000027B0"  # dingbats
+        "\U0001F900-\U0001F9FF"  # supplemental symbols
+        "\U0001FA00-\U0001FA6F"  # chess symbols
+        "\U0001FA70-\U0001FAFF"  # symbols & pictographs extended-A
+        "\U00002600-\U000026FF"  # misc symbols
+        "\U00002300-\U000023FF"  # misc technical
+        "]+",
+        flags=re.UNICODE,
+    )
 
 # Reasoning/thinking block pattern - used by DeepSeek-R1, QwQ, and other 
 # Chain-of-Thought reasoning models that output their thinking process
@@ -112,12 +123,30 @@ THINKING_BLOCK_PATTERN: Final = re.compile(
     flags=re.IGNORECASE,
 )
 
-# URL pattern
-URL_PATTERN: Final = re.compile(
-    r"https?://[^\s\)\]\>]+|www\.[^\s\)\]\>]+",
+
+@lru_cache(maxsize=None)
+def _get_url_pattern() -> re.Pattern[str]:
+    """Compile the URL pattern on first use."""
+    return re.compile(
+        r"https?://[^\s\)\]\>]+|www\.[^\s\)\]\>]+",
+        flags=re.IGNORECASE,
+    )
+
+# Status tags in brackets (LLM action indicators)
+# Supports: German (Aktion), English (action), French (action), Spanish (accion),
+# Italian (azione), Dutch (actie), Portuguese (acao)
+# Tags are located with str.find and checked for a keyword separately, which keeps
+# the scan linear when a response contains unbalanced "[" runs.
+STATUS_TAG_KEYWORDS: Final = re.compile(
+    r"Aktion|action|accion|azione|actie|acao|Handlung|needed|noetig|required|erforderlich|necessaire|necesario|necessario|nodig",
     flags=re.IGNORECASE,
 )
 
+# Whitespace cleanup patterns
+WHITESPACE_PATTERN: Final = re.compile(r"\s+")
+WHITESPACE_RUN_PATTERN: Final = re.compile(r"\s*")
+BLANK_LINES_PATTERN: Final = re.compile(r"\n\s*\n+")
+
 RAW_ERROR_PATTERNS: Final = [
     re.compile(r"\{\s*\"error\"[\s\S]*\}\s*$", flags=re.IGNORECASE),
     re.compile(r"\[[\s\S]*\]\s*$", flags=re.IGNORECASE),
@@ -125,20 +154,48 @@ RAW_ERROR_PATTERNS: Final = [
     re.compile(r"request id[:=]\s*[a-z0-9_-]+", flags=re.IGNORECASE),
 ]
 
-# Markdown patterns
-MARKDOWN_PATTERNS: Final = [
-    (re.compile(r"\*\*(.+?)\*\*"), r"\1"),  # **bold**
-    (re.compile(r"\*(.+?)\*"), r"\1"),      # *italic*
-    (re.compile(r"__(.+?)__"), r"\1"),      # __bold__
-    (re.compile(r"_(.+?)_"), r"\1"),        # _italic_
-    (re.compile(r"~~(.+?)~~"), r"\1"),      # ~~strikethrough~~
-    (re.compile(r"`(.+?)`"), r"\1"),        # `code`
-    (re.compile(r"```[\s\S]*?```"), ""),    # ```code blocks```
-    (re.compile(r"\[([^\]]+)\]\([^\)]+\)"), r"\1"),  # [text](url) -> text
-    (re.compile(r"^#{1,6}\s+", re.MULTILINE), ""),   # # headers
-    (re.compile(r"^\s*[-*+]\s+", re.MULTILINE), ""), # - bullet points
-    (re.compile(r"^\s*\d+\.\s+", re.MULTILINE), ""), # 1. numbered lists
-]
+@lru_cache(maxsize=None)
+def _get_markdown_patterns() -> tuple[tuple[re.Pattern[str], str, str], ...]:
+    """Compile markdown patterns on first use.
+
+    LLM output is untrusted text, so every pattern must stay linear on
+    unbalanced input: link text excludes "[" and list prefixes only skip
+    indentation on the current line (a generic whitespace prefix would
+    backtrack across runs of blank lines).
+
+    The third element lists the characters a match requires; patterns whose
+    characters do not occur in the text are skipped without a regex scan.
+    """
+    return (
+        (re.compile(r"\*\*(.+?)\*\*"), r"\1", "*"),  # **bold**
+        (re.compile(r"\*(.+?)\*"), r"\1", "*"),      # *italic*
+        (re.compile(r"__(.+?)__"), r"\1", "_"),      # __bold__
+        (re.compile(r"_(.+?)_"), r"\1", "_"),        # _italic_
+        (re.compile(r"~~(.+?)~~"), r"\1", "~"),      # ~~strikethrough~~
+        (re.compile(r"`(.+?)`"), r"\1", "`"),        # `code`
+        (re.compile(r"```[\s\S]*?```"), "", "`"),    # ```code blocks```
+        (re.compile(r"\[([^\[\]]+)\]\([^\)]+\)"), r"\1", "["),  # [text](url) -> text
+        (re.compile(r"^#{1,6}\s+", re.MULTILINE), "", "#"),   # # headers
+        (re.compile(r"^[ \t]*[-*+]\s+", re.MULTILINE), "", "-*+"), # - bullet points
+        (re.compile(r"^[ \t]*\d+\.\s+", re.MULTILINE), "", "."), # 1. numbered lists
+    )
+
+
+# Heavy TTS patterns are compiled on first use so Home Assistant startup does
+# not pay for them; the public names stay importable via module __getattr__.
+_LAZY_PATTERNS: Final = {
+    "EMOJI_PATTERN": _get_emoji_pattern,
+    "URL_PATTERN": _get_url_pattern,
+    "MARKDOWN_PATTERNS": _get_markdown_patterns,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily compiled pattern constants (PEP 562)."""
+    factory = _LAZY_PATTERNS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
 
 # Symbol to word mappings (for TTS)
 SYMBOL_MAPPINGS: Final = {
@@ -200,6 +257,46 @@ SYMBOL_MAPPINGS_DE: Final = {
 }
 
 
+@lru_cache(maxsize=None)
+def _get_symbol_pattern(german: bool) -> re.Pattern[str]:
+    """Compile one alternation over all symbol mapping keys.
+
+    Keys are ordered longest first so multi-character symbols such as "°C"
+    and ">=" win over their single-character prefixes. None of the spoken
+    replacements contain a symbol, so one pass gives the same result as
+    replacing each symbol in turn.
+    """
+    symbol_map = SYMBOL_MAPPINGS_DE if german else SYMBOL_MAPPINGS
+    return re.compile(
+        "|".join(re.escape(symbol) for symbol in sorted(symbol_map, key=len, reverse=True))
+    )
+
+
+def _strip_status_tags(text: str) -> str:
+    """Replace bracketed status tags and the whitespace around them with a space.
+
+    Same result as the former regex substitution, but linear: every "]" closes
+    at most one candidate tag, which starts at the first "[" after the previous
+    "]", so no position is rescanned.
+    """
+    parts: list[str] = []
+    pos = 0
+    search_from = 0
+    while (close := text.find("]", search_from)) != -1:
+        start = text.find("[", search_from, close)
+        search_from = close + 1
+        if start == -1 or not STATUS_TAG_KEYWORDS.search(text, start, close):
+            continue
+        parts.append(text[pos:start].rstrip())
+        parts.append(" ")
+        pos = WHITESPACE_RUN_PATTERN.match(text, search_from).end()
+        search_from = pos
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
 def clean_for_tts(text: str, language: str = "") -> str:
     """Clean text for TTS output.
 
@@ -227,40 +324,36 @@ def clean_for_tts(text: str, language: str = "") -> str:
     result = text
 
     # Remove status tags in brackets (LLM action indicators)
-    # Supports: German (Aktion), English (action), French (action), Spanish (accion), 
-    # Italian (azione), Dutch (actie), Portuguese (acao)
-    result = re.sub(
-        r'\s*\[[^\]]*(?:Aktion|action|accion|azione|actie|acao|Handlung|needed|noetig|required|erforderlich|necessaire|necesario|necessario|nodig|necessario)[^\]]*\]\s*',
-        ' ',
-        result,
-        flags=re.IGNORECASE
-    )
+    if "[" in result:
+        result = _strip_status_tags(result)
 
     # Remove <think>...</think> reasoning blocks from reasoning models
     # (DeepSeek-R1, QwQ, Qwen with thinking, etc.)
-    result = THINKING_BLOCK_PATTERN.sub("", result)
-    
+    if "<" in result:
+        result = THINKING_BLOCK_PATTERN.sub("", result)
+
     # Remove emojis
-    result = EMOJI_PATTERN.sub("", result)
+    result = _get_emoji_pattern().sub("", result)
 
     # Remove URLs
-    result = URL_PATTERN.sub("", result)
+    result = _get_url_pattern().sub("", result)
 
-    # Remove markdown formatting
-    for pattern, replacement in MARKDOWN_PATTERNS:
-        result = pattern.sub(replacement, result)
+    # Remove markdown formatting (plain sentences skip most passes)
+    for pattern, replacement, trigger_chars in _get_markdown_patterns():
+        if any(char in result for char in trigger_chars):
+            result = pattern.sub(replacement, result)
 
-    # Convert symbols to words (order matters - longer patterns first)
+    # Convert symbols to words in a single scan
     # Use German symbols if language contains "de" (e.g., "de", "de-DE", "German (Deutsch)")
     is_german = _is_german(language) if language else False
     symbol_map = SYMBOL_MAPPINGS_DE if is_german else SYMBOL_MAPPINGS
-    # Sort by length descending to match longer patterns first
-    for symbol, word in sorted(symbol_map.items(), key=lambda x: len(x[0]), reverse=True):
-        result = result.replace(symbol, word)
+    result = _get_symbol_pattern(is_german).sub(
+        lambda match: symbol_map[match.group(0)], result
+    )
 
     # Clean up extra whitespace
-    result = re.sub(r"\s+", " ", result)
-    result = re.sub(r"\n\s*\n+", "\n", result)
+    result = WHITESPACE_PATTERN.sub(" ", result)
+    result = BLANK_LINES_PATTERN.sub("\n", result)
     result = result.strip()
 
     return result
@@ -282,10 +375,10 @@ def remove_urls_for_tts(text: str) -> str:
     if not text:
         return text
     
-    result = URL_PATTERN.sub("", text)
+    result = _get_url_pattern().sub("", text)
     
     # Clean up extra whitespace after URL removal
-    result = re.sub(r"\s+", " ", result)
+    result = WHITESPACE_PATTERN.sub(" ", result)
     result = result.strip()
     
     return result
@@ -304,8 +397,8 @@ def sanitize_user_facing_error(
     for pattern in RAW_ERROR_PATTERNS:
         safe = pattern.sub("", safe).strip()
 
-    safe = URL_PATTERN.sub("", safe)
-    safe = re.sub(r"\s+", " ", safe).strip(" .:-")
+    safe = _get_url_pattern().sub("", safe)
+    safe = WHITESPACE_PATTERN.sub(" ", safe).strip(" .:-")
 
     lowered = safe.lower()
     if "timeout" in lowered:
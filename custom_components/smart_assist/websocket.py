@@ -7,14 +7,29 @@ Uses HA's native WebSocket API for secure, authenticated communication.
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
 import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 from homeassistant.components import websocket_api
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.components.websocket_api.messages import (
+    construct_event_message,
+    construct_result_message,
+)
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
 import voluptuous as vol
 
 from .const import (
@@ -53,6 +68,7 @@ from .const import (
 from .context.calendar_reminder import CalendarReminderTracker
 from .context.memory import MemoryManager
 from .context.persistent_alarms import PersistentAlarmManager
+from .prompt_builder import build_system_prompt
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,24 +82,68 @@ _EMPTY_PROMPT_RESULT = {
 _EMPTY_MEMORY_DETAILS_RESULT = {"memories": [], "stats": {}}
 _EMPTY_CALENDAR_RESULT = {"enabled": False, "events": [], "calendars": 0}
 _EMPTY_REMOVED_RESULT = {"removed": 0}
+_EMPTY_ALARMS_SUMMARY = {"total": 0, "active": 0, "snoozed": 0, "fired": 0, "dismissed": 0}
+_EMPTY_ALARMS_RESULT = {"alarms": [], "summary": _EMPTY_ALARMS_SUMMARY}
+_EMPTY_DASHBOARD_RESULT = {
+    "agents": {},
+    "tasks": {},
+    "memory": {},
+    "calendar": {},
+    "alarms_summary": _EMPTY_ALARMS_SUMMARY,
+}
+_EMPTY_ALARMS_UPDATE_FRAME = json_bytes(
+    {"update_type": "alarms", "alarms_summary": _EMPTY_ALARMS_SUMMARY}
+)
+_OPT_AGENT_SCHEMA = {vol.Optional("agent_id"): str}
+# Alarm fields copied verbatim into websocket alarm payloads
+_ALARM_PASSTHROUGH_KEYS = (
+    "id",
+    "display_id",
+    "label",
+    "message",
+    "source",
+    "active",
+    "dismissed",
+    "fired",
+    "snoozed_until",
+    "last_fired_at",
+    "fire_count",
+    "created_at",
+    "updated_at",
+)
 _DASHBOARD_METRIC_UPDATE_SIGNAL_SUFFIXES = ("metrics_updated", "cache_warming_updated")
-
-
-def _build_empty_dashboard_result() -> dict[str, Any]:
-    """Return empty dashboard payload shape."""
-    return {
-        "agents": {},
-        "tasks": {},
-        "memory": {},
-        "calendar": {},
-        "alarms_summary": {
-            "total": 0,
-            "active": 0,
-            "snoozed": 0,
-            "fired": 0,
-            "dismissed": 0,
-        },
-    }
+_SUBSCRIBE_DEBOUNCE_SECONDS = 0.1
+# aiohttp's default 4 MiB WebSocket message limit, minus headroom for framing
+_MAX_WS_MESSAGE_BYTES = 4 * 1024 * 1024 - 65536
+# Raw events are dropped early when their calendar entity changes state, but that
+# state only follows the current or next event, so events added further ahead are
+# picked up by expiry alone. Matching the panel's default 30 s refresh bounds that
+# delay to one refresh here, plus the assembled payload's own 30 s cache.
+_CALENDAR_EVENTS_TTL_SECONDS = 30.0
+_CALENDAR_FETCH_TIMEOUT_SECONDS = 8.0
+_CALENDAR_FETCH_CONCURRENCY = 16
+
+# (payload key, subentry config key, default) for dashboard agent/task payloads
+_AGENT_CONFIG_SPECS = (
+    ("model", CONF_MODEL, DEFAULT_MODEL),
+    ("provider", CONF_PROVIDER, DEFAULT_PROVIDER),
+    ("llm_provider", CONF_LLM_PROVIDER, DEFAULT_LLM_PROVIDER),
+    ("temperature", CONF_TEMPERATURE, DEFAULT_TEMPERATURE),
+    ("max_tokens", CONF_MAX_TOKENS, DEFAULT_MAX_TOKENS),
+)
+_AGENT_FEATURE_SPECS = (
+    ("memory", CONF_ENABLE_MEMORY, DEFAULT_ENABLE_MEMORY),
+    ("web_search", CONF_ENABLE_WEB_SEARCH, True),
+    ("calendar_context", CONF_CALENDAR_CONTEXT, DEFAULT_CALENDAR_CONTEXT),
+    ("cache_warming", CONF_ENABLE_CACHE_WARMING, DEFAULT_ENABLE_CACHE_WARMING),
+    ("clean_responses", CONF_CLEAN_RESPONSES, DEFAULT_CLEAN_RESPONSES),
+    ("ask_followup", CONF_ASK_FOLLOWUP, DEFAULT_ASK_FOLLOWUP),
+    ("presence_heuristic", CONF_ENABLE_PRESENCE_HEURISTIC, DEFAULT_ENABLE_PRESENCE_HEURISTIC),
+)
+_TASK_CONFIG_SPECS = (
+    ("model", CONF_MODEL, DEFAULT_MODEL),
+    ("llm_provider", CONF_LLM_PROVIDER, DEFAULT_LLM_PROVIDER),
+)
 
 
 @callback
@@ -105,15 +165,21 @@ def async_register_websocket_commands(hass: HomeAssistant) -> None:
     _LOGGER.debug("Registered Smart Assist WebSocket commands")
 
 
-def _get_subentry_config(data: dict[str, Any], key: str, default: Any = None) -> Any:
-    """Get config value from subentry data with default."""
-    return data.get(key, default)
-
-
 def _get_primary_entry(hass: HomeAssistant) -> Any | None:
     """Return the single Smart Assist config entry if available."""
+    domain_data = hass.data.get(DOMAIN)
+    # Every command resolves the entry; after the first lookup it is one dict access.
+    entry_id = domain_data.get("_primary_entry_id") if domain_data else None
+    if entry_id is not None:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is not None:
+            return entry
     entries = hass.config_entries.async_entries(DOMAIN)
-    return entries[0] if entries else None
+    if not entries:
+        return None
+    if domain_data is not None:
+        domain_data["_primary_entry_id"] = entries[0].entry_id
+    return entries[0]
 
 
 def _get_entry_data(hass: HomeAssistant, entry: Any) -> dict[str, Any]:
@@ -121,9 +187,9 @@ def _get_entry_data(hass: HomeAssistant, entry: Any) -> dict[str, Any]:
     return hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
 
 
-def _get_request_history_store(hass: HomeAssistant, entry: Any) -> Any | None:
+def _get_request_history_store(entry_data: dict[str, Any]) -> Any | None:
     """Return request history store from entry data."""
-    return _get_entry_data(hass, entry).get("request_history")
+    return entry_data.get("request_history")
 
 
 def _find_default_conversation_subentry_id(entry: Any) -> str | None:
@@ -134,13 +200,138 @@ def _find_default_conversation_subentry_id(entry: Any) -> str | None:
     return None
 
 
-def _build_dashboard_update_signal_names(entry: Any) -> list[str]:
-    """Build dispatcher signal names used by dashboard subscriptions."""
-    signal_names: list[str] = []
-    for subentry_id in entry.subentries:
-        for suffix in _DASHBOARD_METRIC_UPDATE_SIGNAL_SUFFIXES:
-            signal_names.append(f"{DOMAIN}_{suffix}_{subentry_id}")
-    return signal_names
+def _get_subentry_index(
+    entry_data: dict[str, Any], entry: Any
+) -> dict[str, list[tuple[str, Any]]]:
+    """Return conversation and ai_task subentries bucketed by type.
+
+    The "calendar" bucket holds the first conversation subentry with calendar
+    context enabled (or nothing), which drives the dashboard calendar section.
+
+    Built lazily once per entry setup; subentry changes reload the entry,
+    which recreates entry_data and therefore the index.
+    """
+    index = entry_data.get("_subentry_index")
+    if index is None:
+        index = {"conversation": [], "ai_task": [], "calendar": []}
+        for subentry_id, subentry in entry.subentries.items():
+            bucket = index.get(subentry.subentry_type)
+            if bucket is not None:
+                bucket.append((subentry_id, subentry))
+        index["calendar"] = [
+            (subentry_id, subentry)
+            for subentry_id, subentry in index["conversation"]
+            if subentry.data.get(CONF_CALENDAR_CONTEXT, DEFAULT_CALENDAR_CONTEXT)
+        ][:1]
+        entry_data["_subentry_index"] = index
+    return index
+
+
+def _build_subentry_update_signal_names(entry: Any) -> list[tuple[str, str]]:
+    """Build (signal name, subentry_id) pairs for per-subentry metric signals.
+
+    Called once per entry setup by the dashboard tracker; subscriptions only
+    connect to the entry-level dashboard and alarm signals.
+    """
+    return [
+        (f"{DOMAIN}_{suffix}_{subentry_id}", subentry_id)
+        for subentry_id in entry.subentries
+        for suffix in _DASHBOARD_METRIC_UPDATE_SIGNAL_SUFFIXES
+    ]
+
+
+@callback
+def async_track_dashboard_updates(hass: HomeAssistant, entry: Any) -> Callable[[], None]:
+    """Track metric signals so cached dashboard agent/task payloads stay fresh.
+
+    Each metric or cache-warming signal bumps a per-subentry version counter.
+    ``_build_agent_data``/``_build_task_data`` reuse their cached payload until
+    the version for that subentry changes; metrics themselves are read per
+    call, since several paths record them without a signal. The change is then re-sent once on
+    the entry-level dashboard signal, so subscriptions connect a single handler
+    regardless of how many subentries exist. Metric and alarm signals also
+    drop the short-lived cached dashboard snapshot, and calendar state changes
+    drop the cached events of that calendar. Entity registry changes drop the
+    serialized alarm payloads and frames, whose resolved satellites depend on it.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    snapshot: dict[str, Any] = entry_data.setdefault(
+        "_dashboard_snapshot", {"versions": {}, "payloads": {}}
+    )
+    versions: dict[str, int] = snapshot["versions"]
+    dashboard_signal = _build_dashboard_update_signal_name(entry)
+
+    def _make_bump(subentry_id: str) -> Callable[..., None]:
+        @callback
+        def _bump(*_: Any) -> None:
+            versions[subentry_id] = versions.get(subentry_id, 0) + 1
+            _invalidate_dashboard_snapshot(entry_data)
+            async_dispatcher_send(hass, dashboard_signal, subentry_id)
+
+        return _bump
+
+    @callback
+    def _alarms_updated(*_: Any) -> None:
+        _invalidate_dashboard_snapshot(entry_data)
+
+    unsubs = [
+        async_dispatcher_connect(hass, signal_name, _make_bump(subentry_id))
+        for signal_name, subentry_id in _build_subentry_update_signal_names(entry)
+    ]
+    unsubs.append(
+        async_dispatcher_connect(
+            hass, _build_alarm_update_signal_name(entry), _alarms_updated
+        )
+    )
+
+    @callback
+    def _entity_registry_updated(_: Event) -> None:
+        entry_data.pop("_serialized_alarms", None)
+        entry_data.pop("_alarm_frames", None)
+
+    unsubs.append(
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _entity_registry_updated)
+    )
+
+    if _get_subentry_index(entry_data, entry)["calendar"]:
+
+        @callback
+        def _calendar_state_changed(event: Event) -> None:
+            entry_data.get("_calendar_cache", {}).pop(event.data["entity_id"], None)
+            entry_data.get("dashboard_cache", {}).pop("calendar", None)
+
+        unsubs.append(
+            async_track_state_change_filtered(
+                hass, TrackStates(False, set(), {"calendar"}), _calendar_state_changed
+            ).async_remove
+        )
+
+    @callback
+    def _unsub_all() -> None:
+        for unsub in unsubs:
+            unsub()
+
+    return _unsub_all
+
+
+def _get_cached_payload(
+    entry_data: dict[str, Any], subentry_id: str
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None, int]:
+    """Return cached payload (or None), the payload store and current version."""
+    snapshot = entry_data.get("_dashboard_snapshot")
+    if snapshot is None:
+        return None, None, 0
+    version = snapshot["versions"].get(subentry_id, 0)
+    payloads = snapshot["payloads"]
+    cached = payloads.get(subentry_id)
+    if cached is not None and cached["version"] == version:
+        return cached["data"], payloads, version
+    return None, payloads, version
+
+
+def _build_dashboard_update_signal_name(entry: Any) -> str:
+    """Build entry-level dispatcher signal carrying the changed subentry_id."""
+    return f"{DOMAIN}_dashboard_updated_{entry.entry_id}"
 
 
 def _build_alarm_update_signal_name(entry: Any) -> str:
@@ -148,16 +339,39 @@ def _build_alarm_update_signal_name(entry: Any) -> str:
     return f"{DOMAIN}_alarms_updated_{entry.entry_id}"
 
 
-def _get_alarm_manager(hass: HomeAssistant, entry: Any) -> PersistentAlarmManager | None:
+def _get_alarm_manager(entry_data: dict[str, Any]) -> PersistentAlarmManager | None:
     """Return persistent alarm manager from entry data."""
-    manager = _get_entry_data(hass, entry).get("persistent_alarm_manager")
+    manager = entry_data.get("persistent_alarm_manager")
     if isinstance(manager, PersistentAlarmManager):
         return manager
     return None
 
 
-def _resolve_satellites_for_alarm(hass: HomeAssistant, delivery: dict[str, Any]) -> list[str]:
-    """Resolve deduplicated assist_satellite entities from delivery metadata."""
+def _resolve_satellites_for_alarm(
+    hass: HomeAssistant,
+    delivery: dict[str, Any],
+    cache: dict[tuple[Any, ...], list[str]] | None = None,
+) -> list[str]:
+    """Resolve deduplicated assist_satellite entities from delivery metadata.
+
+    ``cache`` lets one serialization pass over many alarms reuse the result
+    for alarms sharing the same source satellite and TTS targets.
+    """
+    if cache is None:
+        return _resolve_satellites_uncached(hass, delivery)
+    raw_targets = delivery.get("tts_targets")
+    key = (
+        delivery.get("source_satellite_id"),
+        tuple(map(str, raw_targets)) if isinstance(raw_targets, list) else (),
+    )
+    resolved = cache.get(key)
+    if resolved is None:
+        resolved = cache[key] = _resolve_satellites_uncached(hass, delivery)
+    return resolved
+
+
+def _resolve_satellites_uncached(hass: HomeAssistant, delivery: dict[str, Any]) -> list[str]:
+    """Resolve satellites for one delivery block without memoization."""
     resolved: list[str] = []
     seen: set[str] = set()
 
@@ -173,11 +387,16 @@ def _resolve_satellites_for_alarm(hass: HomeAssistant, delivery: dict[str, Any])
     _add(delivery.get("source_satellite_id"))
 
     raw_targets = delivery.get("tts_targets")
-    targets: list[str] = []
+    media_player_targets: list[str] = []
     if isinstance(raw_targets, list):
-        targets = [str(item or "").strip().lower() for item in raw_targets]
-
-    if not targets:
+        media_player_targets = [
+            target
+            for target in (str(item or "").strip().lower() for item in raw_targets)
+            if target.startswith("media_player.")
+        ]
+
+    # Only media players are resolved through the registry; skip it otherwise.
+    if not media_player_targets:
         return resolved
 
     try:
@@ -185,9 +404,7 @@ def _resolve_satellites_for_alarm(hass: HomeAssistant, delivery: dict[str, Any])
     except Exception:
         return resolved
 
-    for media_player_entity_id in targets:
-        if not media_player_entity_id.startswith("media_player."):
-            continue
+    for media_player_entity_id in media_player_targets:
         try:
             player_entry = registry.async_get(media_player_entity_id)
             device_id = getattr(player_entry, "device_id", None)
@@ -205,51 +422,113 @@ def _resolve_satellites_for_alarm(hass: HomeAssistant, delivery: dict[str, Any])
     return resolved
 
 
-def _serialize_alarm(hass: HomeAssistant, alarm: dict[str, Any]) -> dict[str, Any]:
-    """Return normalized alarm payload for websocket responses."""
-    managed = alarm.get("managed_automation") if isinstance(alarm.get("managed_automation"), dict) else {}
-    direct = alarm.get("direct_execution") if isinstance(alarm.get("direct_execution"), dict) else {}
-    delivery = alarm.get("delivery") if isinstance(alarm.get("delivery"), dict) else {}
-    wake_text = delivery.get("wake_text") if isinstance(delivery.get("wake_text"), dict) else {}
-    resolved_satellites = _resolve_satellites_for_alarm(hass, delivery)
-    status = str(alarm.get("status") or "")
-    can_edit = bool(alarm.get("active")) or status in {"fired", "dismissed"}
-    return {
-        "id": alarm.get("id"),
-        "display_id": alarm.get("display_id"),
-        "label": alarm.get("label"),
-        "message": alarm.get("message"),
-        "source": alarm.get("source"),
-        "status": alarm.get("status"),
-        "active": alarm.get("active"),
-        "dismissed": alarm.get("dismissed"),
-        "fired": alarm.get("fired"),
-        "scheduled_for": alarm.get("scheduled_for"),
-        "next_scheduled_for": alarm.get("next_scheduled_for") or alarm.get("scheduled_for"),
-        "recurrence": alarm.get("recurrence") if isinstance(alarm.get("recurrence"), dict) else None,
-        "snoozed_until": alarm.get("snoozed_until"),
-        "last_fired_at": alarm.get("last_fired_at"),
-        "fire_count": alarm.get("fire_count"),
-        "created_at": alarm.get("created_at"),
-        "updated_at": alarm.get("updated_at"),
-        "managed_enabled": managed.get("enabled", False),
-        "managed_sync_state": managed.get("sync_state"),
-        "managed_last_error": managed.get("last_sync_error"),
-        "managed_automation_entity_id": managed.get("automation_entity_id"),
-        "ownership_verified": managed.get("ownership_verified", False),
-        "execution_mode": alarm.get("execution_mode") or DEFAULT_ALARM_EXECUTION_MODE,
-        "direct_last_state": direct.get("last_state"),
-        "direct_last_executed_at": direct.get("last_executed_at"),
-        "direct_last_error": direct.get("last_error"),
-        "direct_backend_results": direct.get("last_backend_results", {}),
-        "tts_targets": delivery.get("tts_targets") if isinstance(delivery.get("tts_targets"), list) else [],
-        "source_satellite_id": delivery.get("source_satellite_id"),
-        "resolved_satellites": resolved_satellites,
-        "wake_text_dynamic": bool(wake_text.get("dynamic", False)),
-        "wake_text_include_weather": bool(wake_text.get("include_weather", False)),
-        "wake_text_include_news": bool(wake_text.get("include_news", False)),
-        "can_edit": can_edit,
-    }
+def _serialize_alarm(
+    hass: HomeAssistant,
+    alarm: dict[str, Any],
+    satellite_cache: dict[tuple[Any, ...], list[str]] | None = None,
+    *,
+    execution_mode: str | None = None,
+) -> dict[str, Any]:
+    """Return normalized alarm payload for websocket responses.
+
+    ``execution_mode`` overrides the mode stored on the alarm, if any.
+    """
+    managed = alarm.get("managed_automation")
+    if not isinstance(managed, dict):
+        managed = {}
+    direct = alarm.get("direct_execution")
+    if not isinstance(direct, dict):
+        direct = {}
+    delivery = alarm.get("delivery")
+    if not isinstance(delivery, dict):
+        delivery = {}
+    wake_text = delivery.get("wake_text")
+    if not isinstance(wake_text, dict):
+        wake_text = {}
+    recurrence = alarm.get("recurrence")
+    tts_targets = delivery.get("tts_targets")
+    status = alarm.get("status")
+    scheduled_for = alarm.get("scheduled_for")
+
+    payload = {key: alarm.get(key) for key in _ALARM_PASSTHROUGH_KEYS}
+    payload.update(
+        {
+            "status": status,
+            "scheduled_for": scheduled_for,
+            "next_scheduled_for": alarm.get("next_scheduled_for") or scheduled_for,
+            "recurrence": recurrence if isinstance(recurrence, dict) else None,
+            "managed_enabled": managed.get("enabled", False),
+            "managed_sync_state": managed.get("sync_state"),
+            "managed_last_error": managed.get("last_sync_error"),
+            "managed_automation_entity_id": managed.get("automation_entity_id"),
+            "ownership_verified": managed.get("ownership_verified", False),
+            "execution_mode": execution_mode
+            or alarm.get("execution_mode")
+            or DEFAULT_ALARM_EXECUTION_MODE,
+            "direct_last_state": direct.get("last_state"),
+            "direct_last_executed_at": direct.get("last_executed_at"),
+            "direct_last_error": direct.get("last_error"),
+            "direct_backend_results": direct.get("last_backend_results", {}),
+            "tts_targets": tts_targets if isinstance(tts_targets, list) else [],
+            "source_satellite_id": delivery.get("source_satellite_id"),
+            "resolved_satellites": _resolve_satellites_for_alarm(
+                hass, delivery, satellite_cache
+            ),
+            "wake_text_dynamic": bool(wake_text.get("dynamic", False)),
+            "wake_text_include_weather": bool(wake_text.get("include_weather", False)),
+            "wake_text_include_news": bool(wake_text.get("include_news", False)),
+            "can_edit": bool(alarm.get("active"))
+            or str(status or "") in {"fired", "dismissed"},
+        }
+    )
+    return payload
+
+
+def _serialize_alarms(
+    hass: HomeAssistant,
+    entry_data: dict[str, Any],
+    manager: PersistentAlarmManager,
+    alarms: list[dict[str, Any]],
+    execution_mode: str,
+) -> list[dict[str, Any]]:
+    """Serialize alarms, reusing payloads of alarms unchanged since the last call.
+
+    Every alarm mutation stamps ``updated_at``, so it keys the cached payload
+    together with the execution mode. When the store revision moves on, payloads
+    of alarms no longer in the store are dropped so the cache tracks the store.
+    """
+    revision = manager.revision
+    cached_revision, cache = entry_data.get("_serialized_alarms") or (None, {})
+    if cached_revision != revision:
+        stored_ids = {alarm.get("id") for alarm in manager.list_alarms(active_only=False)}
+        cache = {
+            alarm_id: entry for alarm_id, entry in cache.items() if alarm_id in stored_ids
+        }
+        entry_data["_serialized_alarms"] = (revision, cache)
+    satellite_cache: dict[tuple[Any, ...], list[str]] = {}
+    payloads: list[dict[str, Any]] = []
+    for alarm in alarms:
+        alarm_id = alarm.get("id")
+        version = (alarm.get("updated_at"), execution_mode)
+        cached = cache.get(alarm_id)
+        if cached is None or cached[0] != version:
+            cached = (
+                version,
+                _serialize_alarm(hass, alarm, satellite_cache, execution_mode=execution_mode),
+            )
+            cache[alarm_id] = cached
+        payloads.append(cached[1])
+    return payloads
+
+
+@lru_cache(maxsize=128)
+def _parse_tts_targets(raw_targets: str) -> tuple[str, ...]:
+    """Return normalized media_player targets from a comma-separated string."""
+    return tuple(
+        target
+        for token in raw_targets.split(",")
+        if (target := token.strip().lower()).startswith("media_player.")
+    )
 
 
 def _get_alarm_execution_mode_for_entry(hass: HomeAssistant, entry: Any) -> str:
@@ -271,7 +550,8 @@ def _build_alarms_summary(alarms: list[dict[str, Any]]) -> dict[str, int]:
         "dismissed": 0,
     }
     for alarm in alarms:
-        status = str(alarm.get("status") or "")
+        # Statuses are always stored as strings by the alarm manager.
+        status = alarm.get("status")
         if alarm.get("active"):
             summary["active"] += 1
         if status == "snoozed":
@@ -283,6 +563,84 @@ def _build_alarms_summary(alarms: list[dict[str, Any]]) -> dict[str, int]:
     return summary
 
 
+def _get_alarms_summary(
+    entry_data: dict[str, Any],
+    manager: PersistentAlarmManager,
+    active_only: bool = False,
+    alarms: list[dict[str, Any]] | None = None,
+) -> dict[str, int]:
+    """Return alarm summary counts, recounted only after the alarm store changes."""
+    summaries: dict[bool, tuple[int, dict[str, int]]] = entry_data.setdefault(
+        "_alarms_summary", {}
+    )
+    revision = manager.revision
+    cached = summaries.get(active_only)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+    if alarms is None:
+        alarms = manager.list_alarms(active_only=active_only)
+    summary = _build_alarms_summary(alarms)
+    summaries[active_only] = (revision, summary)
+    return summary
+
+
+def _get_alarm_frames(
+    entry_data: dict[str, Any], manager: PersistentAlarmManager
+) -> dict[Any, bytes]:
+    """Return encoded alarm list results for the current alarm store revision."""
+    revision = manager.revision
+    cached = entry_data.get("_alarm_frames")
+    if cached is None or cached[0] != revision:
+        cached = (revision, {})
+        entry_data["_alarm_frames"] = cached
+    return cached[1]
+
+
+def _get_alarms_update_frame(entry_data: dict[str, Any]) -> bytes:
+    """Return the encoded alarms update pushed to dashboard subscribers."""
+    manager = _get_alarm_manager(entry_data)
+    if manager is None:
+        return _EMPTY_ALARMS_UPDATE_FRAME
+    frames = _get_alarm_frames(entry_data, manager)
+    frame = frames.get("subscribe")
+    if frame is None:
+        frame = json_bytes(
+            {
+                "update_type": "alarms",
+                "alarms_summary": _get_alarms_summary(entry_data, manager),
+            }
+        )
+        frames["subscribe"] = frame
+    return frame
+
+
+async def _post_alarm_mutation(
+    hass: HomeAssistant,
+    entry: Any,
+    manager: PersistentAlarmManager,
+    alarm: dict[str, Any] | None,
+    reason: str,
+) -> None:
+    """Persist an alarm mutation, fire the update event and refresh dashboards."""
+    await manager.async_force_save()
+    if alarm is not None:
+        hass.bus.async_fire(
+            PERSISTENT_ALARM_EVENT_UPDATED,
+            {
+                "entry_id": entry.entry_id,
+                "alarm_id": alarm.get("id"),
+                "display_id": alarm.get("display_id"),
+                "status": alarm.get("status"),
+                "active": alarm.get("active"),
+                "scheduled_for": alarm.get("scheduled_for"),
+                "snoozed_until": alarm.get("snoozed_until"),
+                "updated_at": alarm.get("updated_at"),
+                "reason": reason,
+            },
+        )
+    async_dispatcher_send(hass, _build_alarm_update_signal_name(entry))
+
+
 def _get_request_history_store_or_send_default(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -295,7 +653,7 @@ def _get_request_history_store_or_send_default(
         connection.send_result(msg["id"], default_payload)
         return None
 
-    store = _get_request_history_store(hass, entry)
+    store = _get_request_history_store(_get_entry_data(hass, entry))
     if not store:
         connection.send_result(msg["id"], default_payload)
         return None
@@ -345,217 +703,259 @@ def _get_history_summary(entry_data: dict[str, Any], agent_id: str) -> dict[str,
     return request_history.get_summary_stats(agent_id=agent_id)
 
 
-def _build_agent_data(
-    hass: HomeAssistant,
-    entry_id: str,
+def _get_static_payload(
+    entry_data: dict[str, Any],
     subentry_id: str,
     subentry: Any,
+    config_specs: tuple[tuple[str, str, Any], ...],
+    feature_specs: tuple[tuple[str, str, Any], ...] | None = None,
 ) -> dict[str, Any]:
-    """Build dashboard data for a single conversation agent."""
-    data = subentry.data
-    domain_data = hass.data.get(DOMAIN, {})
-    entry_data = domain_data.get(entry_id, {})
+    """Return the config-derived part of a dashboard payload.
+
+    Subentry data only changes through a reload, which recreates entry_data,
+    so the result is built once per setup and merged into every payload.
+    """
+    static_payloads = entry_data.setdefault("_static_payloads", {})
+    static = static_payloads.get(subentry_id)
+    if static is None:
+        data = subentry.data
+        static = {
+            "name": subentry.title,
+            **{name: data.get(key, default) for name, key, default in config_specs},
+        }
+        if feature_specs is not None:
+            features = {name: data.get(key, default) for name, key, default in feature_specs}
+            features["prompt_caching"] = True
+            static["features"] = features
+        static_payloads[subentry_id] = static
+    return static
 
-    # Get LLM metrics
-    agents = entry_data.get("agents", {})
-    agent_info = agents.get(subentry_id, {})
-    llm_client = agent_info.get("llm_client")
 
-    metrics_dict = {}
-    if llm_client and hasattr(llm_client, "metrics"):
-        metrics_dict = llm_client.metrics.to_dict()
+def _get_metrics_dict(info: dict[str, Any]) -> dict[str, Any]:
+    """Return current LLM metrics of a registered agent or task."""
+    # Read through the client each time; reset_metrics() swaps the object.
+    llm_client = info.get("llm_client")
+    return llm_client.metrics.to_dict() if llm_client else {}
+
+
+def _build_agent_data(
+    entry_data: dict[str, Any],
+    subentry_id: str,
+    subentry: Any,
+) -> dict[str, Any]:
+    """Build dashboard data for a single conversation agent."""
+    # Get registration info (LLM client, tool names)
+    agent_info = entry_data.get("agents", {}).get(subentry_id, {})
+
+    # History and metrics change on paths that send no signal (history clear and
+    # pruning, cancelled requests, alarm announcements, failed cache warming), so
+    # both are read per call instead of living in the versioned payload.
+    live = {
+        "metrics": _get_metrics_dict(agent_info),
+        "history_summary": _get_history_summary(entry_data, subentry_id),
+    }
+    cached, payloads, version = _get_cached_payload(entry_data, subentry_id)
+    if cached is not None:
+        return {**cached, **live}
 
     # Get cache warming data
     cache_warming = entry_data.get("cache_warming", {}).get(subentry_id)
 
     # Get registered tools
-    entity = agent_info.get("entity")
-    tools_list: list[str] = []
-    if entity and hasattr(entity, "get_registered_tool_names"):
-        tools_list = entity.get_registered_tool_names()
+    get_tool_names = agent_info.get("get_tool_names")
+    tools_list: list[str] = get_tool_names() if get_tool_names else []
 
-    return {
-        "name": subentry.title,
-        "model": _get_subentry_config(data, CONF_MODEL, DEFAULT_MODEL),
-        "provider": _get_subentry_config(data, CONF_PROVIDER, DEFAULT_PROVIDER),
-        "llm_provider": _get_subentry_config(data, CONF_LLM_PROVIDER, DEFAULT_LLM_PROVIDER),
-        "temperature": _get_subentry_config(data, CONF_TEMPERATURE, DEFAULT_TEMPERATURE),
-        "max_tokens": _get_subentry_config(data, CONF_MAX_TOKENS, DEFAULT_MAX_TOKENS),
-        "features": {
-            "memory": _get_subentry_config(data, CONF_ENABLE_MEMORY, DEFAULT_ENABLE_MEMORY),
-            "web_search": _get_subentry_config(data, CONF_ENABLE_WEB_SEARCH, True),
-            "calendar_context": _get_subentry_config(data, CONF_CALENDAR_CONTEXT, DEFAULT_CALENDAR_CONTEXT),
-            "prompt_caching": True,
-            "cache_warming": _get_subentry_config(data, CONF_ENABLE_CACHE_WARMING, DEFAULT_ENABLE_CACHE_WARMING),
-            "clean_responses": _get_subentry_config(data, CONF_CLEAN_RESPONSES, DEFAULT_CLEAN_RESPONSES),
-            "ask_followup": _get_subentry_config(data, CONF_ASK_FOLLOWUP, DEFAULT_ASK_FOLLOWUP),
-            "presence_heuristic": _get_subentry_config(data, CONF_ENABLE_PRESENCE_HEURISTIC, DEFAULT_ENABLE_PRESENCE_HEURISTIC),
-        },
-        "metrics": metrics_dict,
+    payload = {
+        **_get_static_payload(
+            entry_data, subentry_id, subentry, _AGENT_CONFIG_SPECS, _AGENT_FEATURE_SPECS
+        ),
         "cache_warming": cache_warming,
         "tools": tools_list,
-        "history_summary": _get_history_summary(entry_data, subentry_id),
     }
+    # Only cache once the agent is registered, so its first payload is not pinned empty.
+    if payloads is not None and agent_info:
+        payloads[subentry_id] = {"version": version, "data": payload}
+    return {**payload, **live}
 
 
 def _build_task_data(
-    hass: HomeAssistant,
-    entry_id: str,
+    entry_data: dict[str, Any],
     subentry_id: str,
     subentry: Any,
 ) -> dict[str, Any]:
     """Build dashboard data for a single AI task."""
-    data = subentry.data
-    domain_data = hass.data.get(DOMAIN, {})
-    entry_data = domain_data.get(entry_id, {})
+    # Get registration info (LLM client, tool names)
+    task_info = entry_data.get("tasks", {}).get(subentry_id, {})
 
-    # Get LLM metrics
-    tasks = entry_data.get("tasks", {})
-    task_info = tasks.get(subentry_id, {})
-    llm_client = task_info.get("llm_client")
-
-    metrics_dict = {}
-    if llm_client and hasattr(llm_client, "metrics"):
-        metrics_dict = llm_client.metrics.to_dict()
+    # Metrics are read per call, like for agents.
+    metrics_dict = _get_metrics_dict(task_info)
+    cached, payloads, version = _get_cached_payload(entry_data, subentry_id)
+    if cached is not None:
+        return {**cached, "metrics": metrics_dict}
 
     # Get registered tools
-    entity = task_info.get("entity")
-    tools_list: list[str] = []
-    if entity and hasattr(entity, "get_registered_tool_names"):
-        tools_list = entity.get_registered_tool_names()
+    get_tool_names = task_info.get("get_tool_names")
+    tools_list: list[str] = get_tool_names() if get_tool_names else []
 
-    return {
-        "name": subentry.title,
-        "model": _get_subentry_config(data, CONF_MODEL, DEFAULT_MODEL),
-        "llm_provider": _get_subentry_config(data, CONF_LLM_PROVIDER, DEFAULT_LLM_PROVIDER),
-        "metrics": metrics_dict,
+    payload = {
+        **_get_static_payload(entry_data, subentry_id, subentry, _TASK_CONFIG_SPECS),
         "tools": tools_list,
     }
+    if payloads is not None and task_info:
+        payloads[subentry_id] = {"version": version, "data": payload}
+    return {**payload, "metrics": metrics_dict}
 
 
-def _build_memory_summary(hass: HomeAssistant, entry_id: str) -> dict[str, Any]:
+def _build_memory_summary(entry_data: dict[str, Any]) -> dict[str, Any]:
     """Build memory statistics summary."""
-    domain_data = hass.data.get(DOMAIN, {})
-    entry_data = domain_data.get(entry_id, {})
-    memory_manager = entry_data.get("memory_manager")
+    # Setup only ever stores a MemoryManager here, so presence is enough.
+    memory_manager: MemoryManager | None = entry_data.get("memory_manager")
 
-    if not isinstance(memory_manager, MemoryManager):
+    if memory_manager is None:
         return {
             "total_users": 0,
             "total_memories": 0,
             "global_memories": 0,
             "users": {},
         }
-    return memory_manager.get_summary()
+    # Recount only after the memory store changes; deltas ask on every flush.
+    revision = memory_manager.revision
+    cached = entry_data.get("_memory_summary")
+    if cached is None or cached[0] != revision:
+        cached = (revision, memory_manager.get_summary())
+        entry_data["_memory_summary"] = cached
+    return cached[1]
 
 
 async def _build_calendar_data(
     hass: HomeAssistant,
-    entry_id: str,
+    entry_data: dict[str, Any],
     entry: Any,
 ) -> dict[str, Any]:
     """Build calendar events data with reminder status for dashboard."""
-    from datetime import timedelta
-
-    from homeassistant.util import dt as dt_util
-
-    domain_data = hass.data.get(DOMAIN, {})
-    entry_data = domain_data.get(entry_id, {})
+    # Conversation agent with calendar context enabled, resolved once per setup
+    calendar_subentries = _get_subentry_index(entry_data, entry)["calendar"]
+    if not calendar_subentries:
+        return {"enabled": False, "events": [], "calendars": 0}
 
-    # Find a conversation agent with calendar context enabled
-    calendar_enabled = False
     reminder_tracker: CalendarReminderTracker | None = None
-
-    for subentry_id, subentry in entry.subentries.items():
-        if subentry.subentry_type == "conversation":
-            if subentry.data.get(CONF_CALENDAR_CONTEXT, DEFAULT_CALENDAR_CONTEXT):
-                calendar_enabled = True
-                agents = entry_data.get("agents", {})
-                agent_info = agents.get(subentry_id, {})
-                entity = agent_info.get("entity")
-                if entity and hasattr(entity, "get_calendar_reminder_tracker"):
-                    reminder_tracker = entity.get_calendar_reminder_tracker()
-                break
-
-    if not calendar_enabled:
-        return {"enabled": False, "events": [], "calendars": 0}
+    subentry_id = calendar_subentries[0][0]
+    entity = entry_data.get("agents", {}).get(subentry_id, {}).get("entity")
+    get_reminder_tracker = getattr(entity, "get_calendar_reminder_tracker", None)
+    if get_reminder_tracker is not None:
+        reminder_tracker = get_reminder_tracker()
 
     # Fetch events from all calendar entities
     now = dt_util.now()
     end = now + timedelta(hours=28)
 
-    calendars = [
-        state.entity_id
-        for state in hass.states.async_all()
-        if state.entity_id.startswith("calendar.")
-    ]
+    calendars = hass.states.async_entity_ids("calendar")
 
     if not calendars:
         return {"enabled": True, "events": [], "calendars": 0}
 
-    semaphore = asyncio.Semaphore(4)
+    # Calendar entity component; entities are called directly instead of via the
+    # calendar.get_events service to skip service dispatch and schema validation.
+    calendar_component = hass.data.get("calendar")
+    # Bounds concurrent fetches against remote calendar backends.
+    semaphore = asyncio.Semaphore(min(_CALENDAR_FETCH_CONCURRENCY, len(calendars)))
+    events_cache: dict[str, tuple[float, list[dict[str, Any]]]] = entry_data.setdefault(
+        "_calendar_cache", {}
+    )
+    # cal_id -> (friendly_name it was derived from, owner); a rename invalidates it.
+    owner_cache: dict[str, tuple[str | None, str]] = entry_data.setdefault(
+        "_calendar_owner", {}
+    )
+
+    async def _fetch_raw_events(cal_id: str) -> list[dict[str, Any]] | None:
+        """Return raw calendar events, reusing results younger than the TTL."""
+        cached = events_cache.get(cal_id)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        calendar_entity = calendar_component.get_entity(cal_id) if calendar_component else None
+        if calendar_entity is None:
+            return None
+        async with semaphore:
+            calendar_events = await calendar_entity.async_get_events(hass, now, end)
+
+        # Same fields and ISO formatting as the calendar.get_events service response
+        raw_events = [
+            {
+                "summary": event.summary,
+                "start": event.start.isoformat(),
+                "end": event.end.isoformat(),
+                "location": event.location,
+            }
+            for event in calendar_events
+        ]
+        events_cache[cal_id] = (time.monotonic() + _CALENDAR_EVENTS_TTL_SECONDS, raw_events)
+        return raw_events
 
     async def _fetch_calendar(cal_id: str) -> list[dict[str, Any]]:
         try:
-            async with semaphore:
-                async with asyncio.timeout(8):
-                    result = await hass.services.async_call(
-                        "calendar",
-                        "get_events",
-                        {
-                            "entity_id": cal_id,
-                            "start_date_time": now.isoformat(),
-                            "end_date_time": end.isoformat(),
-                        },
-                        blocking=True,
-                        return_response=True,
-                    )
-
-            if not result or cal_id not in result:
+            raw_events = await _fetch_raw_events(cal_id)
+            if raw_events is None:
                 return []
 
             state = hass.states.get(cal_id)
-            if state and state.attributes.get("friendly_name"):
-                owner = state.attributes["friendly_name"]
+            friendly_name = state.attributes.get("friendly_name") if state else None
+            cached_owner = owner_cache.get(cal_id)
+            if cached_owner is not None and cached_owner[0] == friendly_name:
+                owner = cached_owner[1]
             else:
-                name = cal_id.split(".", 1)[-1]
-                owner = name.replace("_", " ").title()
+                if friendly_name:
+                    owner = friendly_name
+                else:
+                    name = cal_id.split(".", 1)[-1]
+                    owner = name.replace("_", " ").title()
+                owner_cache[cal_id] = (friendly_name, owner)
 
-            events: list[dict[str, Any]] = []
-            for event in result[cal_id].get("events", []):
-                event_data = {
+            events = [
+                {
                     "summary": event.get("summary", "Untitled"),
                     "start": event.get("start"),
                     "end": event.get("end"),
                     "owner": owner,
                     "calendar": cal_id,
                     "location": event.get("location"),
+                    "status": "upcoming",
                 }
-
-                status = "upcoming"
-                if reminder_tracker:
-                    status = reminder_tracker.get_event_status(event_data, now)
-
-                event_data["status"] = status
-                events.append(event_data)
+                for event in raw_events
+            ]
+            # get_events already returns events by start; sorting a sorted list is
+            # linear and keeps the merge below correct for any provider.
+            events.sort(key=itemgetter("start"))
+            if reminder_tracker:
+                for event_data in events:
+                    event_data["status"] = reminder_tracker.get_event_status(event_data, now)
 
             return events
-        except TimeoutError:
-            _LOGGER.debug("Timeout while fetching calendar events from %s", cal_id)
         except Exception as err:
             _LOGGER.debug("Failed to fetch calendar events from %s: %s", cal_id, err)
         return []
 
-    results = await asyncio.gather(
-        *(_fetch_calendar(cal_id) for cal_id in calendars),
-        return_exceptions=False,
-    )
-
-    all_events: list[dict[str, Any]] = []
-    for events in results:
-        all_events.extend(events)
+    # One deadline for the whole fan-out; results are collected as they arrive
+    # and calendars still pending at the deadline are dropped.
+    tasks = [hass.async_create_task(_fetch_calendar(cal_id)) for cal_id in calendars]
+    per_calendar_events: list[list[dict[str, Any]]] = []
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=_CALENDAR_FETCH_TIMEOUT_SECONDS):
+            if events := await next_done:
+                per_calendar_events.append(events)
+    except TimeoutError:
+        _LOGGER.debug(
+            "Timeout while fetching calendar events from %d calendar(s)",
+            sum(not task.done() for task in tasks),
+        )
+    finally:
+        # Also reached when the caller is cancelled, so no fetch outlives the build.
+        for task in tasks:
+            if not task.done():
+                task.cancel()
 
-    all_events.sort(key=lambda x: x.get("start", ""))
+    # k-way merge of the per-calendar lists instead of concatenating and resorting.
+    all_events = list(heapq.merge(*per_calendar_events, key=itemgetter("start")))
 
     return {
         "enabled": True,
@@ -571,32 +971,61 @@ async def _build_dashboard_snapshot(
     include_calendar: bool,
 ) -> dict[str, Any]:
     """Build dashboard snapshot with optional heavy calendar section."""
+    entry_data = _get_entry_data(hass, entry)
+    subentry_index = _get_subentry_index(entry_data, entry)
+    manager: PersistentAlarmManager | None = entry_data.get("persistent_alarm_manager")
     result: dict[str, Any] = {
-        "agents": {},
-        "tasks": {},
-        "memory": {},
+        "agents": {
+            subentry_id: _build_agent_data(entry_data, subentry_id, subentry)
+            for subentry_id, subentry in subentry_index["conversation"]
+        },
+        "tasks": {
+            subentry_id: _build_task_data(entry_data, subentry_id, subentry)
+            for subentry_id, subentry in subentry_index["ai_task"]
+        },
+        "memory": _build_memory_summary(entry_data),
+        "alarms_summary": (
+            _get_alarms_summary(entry_data, manager) if manager else _EMPTY_ALARMS_SUMMARY
+        ),
     }
 
-    for subentry_id, subentry in entry.subentries.items():
-        if subentry.subentry_type == "conversation":
-            result["agents"][subentry_id] = _build_agent_data(
-                hass, entry.entry_id, subentry_id, subentry
-            )
-        elif subentry.subentry_type == "ai_task":
-            result["tasks"][subentry_id] = _build_task_data(
-                hass, entry.entry_id, subentry_id, subentry
-            )
+    if include_calendar:
+        result["calendar"] = await _build_calendar_data(hass, entry_data, entry)
+
+    return result
 
-    result["memory"] = _build_memory_summary(hass, entry.entry_id)
 
-    manager = _get_alarm_manager(hass, entry)
-    alarms = manager.list_alarms(active_only=False) if manager else []
-    result["alarms_summary"] = _build_alarms_summary(alarms)
+def _invalidate_dashboard_snapshot(entry_data: dict[str, Any]) -> None:
+    """Force the next dashboard_data request to rebuild its snapshot."""
+    dashboard_cache = entry_data.get("dashboard_cache")
+    if dashboard_cache is not None:
+        dashboard_cache.pop("snapshot", None)
 
-    if include_calendar:
-        result["calendar"] = await _build_calendar_data(hass, entry.entry_id, entry)
 
-    return result
+async def _get_cached_dashboard_snapshot(
+    hass: HomeAssistant,
+    entry: Any,
+    ttl_seconds: float = 1.0,
+) -> dict[str, Any]:
+    """Return dashboard snapshot (without calendar) using a short-lived cache.
+
+    Metric, alarm and memory mutations invalidate it eagerly; the TTL bounds
+    staleness for changes that have no signal of their own.
+    """
+    entry_data = _get_entry_data(hass, entry)
+    dashboard_cache = entry_data.setdefault("dashboard_cache", {})
+
+    now_monotonic = time.monotonic()
+    cached = dashboard_cache.get("snapshot")
+    cached_at = dashboard_cache.get("snapshot_cached_at", 0.0)
+
+    if cached is not None and (now_monotonic - cached_at) < ttl_seconds:
+        return cached
+
+    snapshot = await _build_dashboard_snapshot(hass, entry, include_calendar=False)
+    dashboard_cache["snapshot"] = snapshot
+    dashboard_cache["snapshot_cached_at"] = now_monotonic
+    return snapshot
 
 
 async def _get_cached_calendar_data(
@@ -616,7 +1045,7 @@ async def _get_cached_calendar_data(
     if cached is not None and (now_monotonic - cached_at) < ttl_seconds:
         return cached
 
-    calendar = await _build_calendar_data(hass, entry.entry_id, entry)
+    calendar = await _build_calendar_data(hass, entry_data, entry)
     dashboard_cache["calendar"] = calendar
     dashboard_cache["calendar_cached_at"] = now_monotonic
     return calendar
@@ -635,16 +1064,37 @@ async def ws_dashboard_data(
     msg: dict[str, Any],
 ) -> None:
     """Return all dashboard data for Smart Assist."""
-    result = _build_empty_dashboard_result()
-
-    entry = _get_primary_entry_or_send_default(hass, connection, msg, result)
+    entry = _get_primary_entry_or_send_default(
+        hass, connection, msg, _EMPTY_DASHBOARD_RESULT
+    )
     if not entry:
         return
 
-    result = await _build_dashboard_snapshot(hass, entry, include_calendar=False)
-    result["calendar"] = await _get_cached_calendar_data(hass, entry)
-
-    connection.send_result(msg["id"], result)
+    # Start the calendar fetch first so its calendar reads overlap the sync builders.
+    calendar_task = hass.async_create_task(_get_cached_calendar_data(hass, entry))
+    try:
+        snapshot = await _get_cached_dashboard_snapshot(hass, entry)
+    except BaseException:
+        # Nothing would await the fetch anymore; don't leave it running unobserved.
+        calendar_task.cancel()
+        raise
+    calendar = await calendar_task
+
+    # Both cached halves are rebuilt rather than mutated, so identity shows the frame is current.
+    dashboard_cache = _get_entry_data(hass, entry).setdefault("dashboard_cache", {})
+    cached_frame = dashboard_cache.get("result_frame")
+    if (
+        cached_frame is not None
+        and cached_frame[0] is snapshot
+        and cached_frame[1] is calendar
+    ):
+        frame = cached_frame[2]
+    else:
+        # Copy before adding calendar; the cached snapshot is shared between requests.
+        frame = json_bytes({**snapshot, "calendar": calendar})
+        dashboard_cache["result_frame"] = (snapshot, calendar, frame)
+
+    connection.send_message(construct_result_message(msg["id"], frame))
 
 
 @websocket_api.websocket_command(
@@ -706,15 +1156,20 @@ def _get_memory_manager_or_send_error(
     return memory_manager
 
 
-async def _finalize_memory_mutation(
+@callback
+def _finalize_memory_mutation(
+    hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
     memory_manager: MemoryManager,
     result_message: str,
 ) -> None:
-    """Persist memory mutation and send standard success payload."""
-    await memory_manager.async_force_save()
+    """Send standard success payload, then persist the mutation in the background."""
+    entry = _get_primary_entry(hass)
+    if entry:
+        _invalidate_dashboard_snapshot(_get_entry_data(hass, entry))
     connection.send_result(msg["id"], {"message": result_message})
+    hass.async_create_task(memory_manager.async_force_save())
 
 
 @websocket_api.websocket_command(
@@ -737,7 +1192,7 @@ async def ws_memory_rename_user(
         return
 
     result = memory_manager.rename_user(msg["user_id"], msg["display_name"])
-    await _finalize_memory_mutation(connection, msg, memory_manager, result)
+    _finalize_memory_mutation(hass, connection, msg, memory_manager, result)
 
 
 @websocket_api.websocket_command(
@@ -760,7 +1215,7 @@ async def ws_memory_merge_users(
         return
 
     result = memory_manager.merge_users(msg["source_user_id"], msg["target_user_id"])
-    await _finalize_memory_mutation(connection, msg, memory_manager, result)
+    _finalize_memory_mutation(hass, connection, msg, memory_manager, result)
 
 
 @websocket_api.websocket_command(
@@ -783,7 +1238,7 @@ async def ws_memory_delete(
         return
 
     result = memory_manager.delete_memory(msg["user_id"], msg["memory_id"])
-    await _finalize_memory_mutation(connection, msg, memory_manager, result)
+    _finalize_memory_mutation(hass, connection, msg, memory_manager, result)
 
 
 @websocket_api.websocket_command(
@@ -807,74 +1262,108 @@ async def ws_subscribe(
         connection.send_result(msg["id"])
         return
 
-    send_in_progress = False
-    send_pending_types: set[str] = set()
+    pending_types: set[str] = set()
+    pending_subentry_ids: set[str] = set()
+    pending_flush_handle: asyncio.TimerHandle | None = None
+    last_alarms_frame: bytes | None = None
+
+    @callback
+    def _build_delta(entry_data: dict[str, Any]) -> dict[str, Any]:
+        """Build a delta update holding only the subentries that changed."""
+        subentry_index = _get_subentry_index(entry_data, entry)
+        changed = set(pending_subentry_ids)
+        pending_subentry_ids.clear()
+        return {
+            "update_type": "delta",
+            "agents": {
+                subentry_id: _build_agent_data(entry_data, subentry_id, subentry)
+                for subentry_id, subentry in subentry_index["conversation"]
+                if subentry_id in changed
+            },
+            "tasks": {
+                subentry_id: _build_task_data(entry_data, subentry_id, subentry)
+                for subentry_id, subentry in subentry_index["ai_task"]
+                if subentry_id in changed
+            },
+            # Memory has no signal of its own; conversations update it alongside metrics.
+            "memory": _build_memory_summary(entry_data),
+        }
 
-    async def _flush_updates() -> None:
-        """Send coalesced lightweight dashboard updates."""
-        nonlocal send_in_progress, send_pending_types
-        send_in_progress = True
+    @callback
+    def _flush_updates() -> None:
+        """Send all coalesced dashboard updates as a single message."""
+        nonlocal pending_flush_handle, last_alarms_frame
+        pending_flush_handle = None
+        # Metrics go first so agent updates land before any alarm refresh.
+        update_types = sorted(pending_types, key=lambda update_type: update_type != "metrics")
+        pending_types.clear()
+        # Resolved per flush, not per subscription: a reload replaces entry data.
+        entry_data = _get_entry_data(hass, entry)
+        # Each update is encoded once; alarm frames are shared by every subscriber.
+        frames: list[bytes] = []
+        for update_type in update_types:
+            if update_type == "alarms":
+                frame = _get_alarms_update_frame(entry_data)
+                # Frames are cached per store revision, so the same object means
+                # nothing changed since the last push and the client is current.
+                if frame is last_alarms_frame:
+                    continue
+                last_alarms_frame = frame
+                frames.append(frame)
+            else:
+                frames.append(json_bytes(_build_delta(entry_data)))
+        if len(frames) > 1:
+            batch = b'{"update_type":"batch","updates":[' + b",".join(frames) + b"]}"
+            # Oversized batches go out per update so the client never drops the connection.
+            if len(batch) <= _MAX_WS_MESSAGE_BYTES:
+                frames = [batch]
         try:
-            while send_pending_types:
-                if "metrics" in send_pending_types:
-                    update_type = "metrics"
-                    send_pending_types.remove("metrics")
-                else:
-                    update_type = send_pending_types.pop()
-
-                if update_type == "alarms":
-                    manager = _get_alarm_manager(hass, entry)
-                    alarms = manager.list_alarms(active_only=False) if manager else []
-                    result = {
-                        "update_type": "alarms",
-                        "alarms_summary": _build_alarms_summary(alarms),
-                    }
-                else:
-                    result = await _build_dashboard_snapshot(
-                        hass,
-                        entry,
-                        include_calendar=False,
-                    )
-                    result["update_type"] = "metrics"
-                try:
-                    connection.send_message(websocket_api.event_message(msg["id"], result))
-                except Exception:  # noqa: BLE001
-                    _LOGGER.debug("WebSocket connection closed before message could be sent")
-                    return
-                await asyncio.sleep(0.5)
-        finally:
-            send_in_progress = False
+            for frame in frames:
+                connection.send_message(construct_event_message(msg["id"], frame))
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("WebSocket connection closed before message could be sent")
 
     @callback
-    def forward_update(update_type: str = "metrics", data: dict | None = None) -> None:
-        """Forward coalesced metric updates to WebSocket client."""
-        nonlocal send_pending_types
-        send_pending_types.add(update_type)
-        if not send_in_progress:
-            hass.add_job(_flush_updates())
-
-    unsub_callbacks: list[Any] = []
-    for signal_name in _build_dashboard_update_signal_names(entry):
-        unsub = async_dispatcher_connect(
-            hass,
-            signal_name,
-            lambda data=None: forward_update("metrics", data),
-        )
-        unsub_callbacks.append(unsub)
+    def forward_update(update_type: str = "metrics", subentry_id: str | None = None) -> None:
+        """Collect dispatcher signals and flush them after a short debounce window."""
+        nonlocal pending_flush_handle
+        pending_types.add(update_type)
+        if subentry_id is not None:
+            pending_subentry_ids.add(subentry_id)
+        if pending_flush_handle is None:
+            pending_flush_handle = hass.loop.call_later(
+                _SUBSCRIBE_DEBOUNCE_SECONDS, _flush_updates
+            )
+
+    # Dispatcher targets must be callbacks; plain lambdas would run in the executor.
+    @callback
+    def _on_dashboard_update(subentry_id: str) -> None:
+        forward_update("metrics", subentry_id)
 
-    unsub_callbacks.append(
+    @callback
+    def _on_alarms_update(*_: Any) -> None:
+        forward_update("alarms")
+
+    unsub_callbacks = [
         async_dispatcher_connect(
-            hass,
-            _build_alarm_update_signal_name(entry),
-            lambda data=None: forward_update("alarms", data),
-        )
-    )
+            hass, _build_dashboard_update_signal_name(entry), _on_dashboard_update
+        ),
+        async_dispatcher_connect(
+            hass, _build_alarm_update_signal_name(entry), _on_alarms_update
+        ),
+    ]
 
     @callback
     def unsub_all() -> None:
         """Unsubscribe from all signals."""
+        nonlocal pending_flush_handle
         for unsub in unsub_callbacks:
             unsub()
+        if pending_flush_handle is not None:
+            pending_flush_handle.cancel()
+            pending_flush_handle = None
+        pending_types.clear()
+        pending_subentry_ids.clear()
 
     connection.subscriptions[msg["id"]] = unsub_all
     connection.send_result(msg["id"])
@@ -910,7 +1399,7 @@ async def ws_calendar_data(
     {
         vol.Required("type"): "smart_assist/alarms_data",
         vol.Optional("active_only", default=False): bool,
-        vol.Optional("limit"): int,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.require_admin
@@ -925,251 +1414,233 @@ async def ws_alarms_data(
         hass,
         connection,
         msg,
-        {"alarms": [], "summary": _build_alarms_summary([])},
+        _EMPTY_ALARMS_RESULT,
     )
     if not entry:
         return
 
-    manager = _get_alarm_manager(hass, entry)
+    entry_data = _get_entry_data(hass, entry)
+    manager = _get_alarm_manager(entry_data)
     if manager is None:
-        connection.send_result(msg["id"], {"alarms": [], "summary": _build_alarms_summary([])})
+        connection.send_result(msg["id"], _EMPTY_ALARMS_RESULT)
         return
 
-    alarms = manager.list_alarms(active_only=bool(msg.get("active_only", False)))
-    execution_mode = _get_alarm_execution_mode_for_entry(hass, entry)
-    for alarm in alarms:
-        alarm["execution_mode"] = execution_mode
-    summary = _build_alarms_summary(alarms)
+    active_only = bool(msg.get("active_only", False))
     limit = msg.get("limit")
-    if isinstance(limit, int) and limit > 0:
-        alarms = alarms[:limit]
+    execution_mode = _get_alarm_execution_mode_for_entry(hass, entry)
 
-    connection.send_result(
-        msg["id"],
-        {
-            "alarms": [_serialize_alarm(hass, alarm) for alarm in alarms],
-            "summary": summary,
-            "execution_mode": execution_mode,
-        },
-    )
+    # Identical full-list requests against an unchanged store reuse the encoded
+    # result. Limited requests are encoded per call: keying on the client-chosen
+    # limit would let one revision collect a frame per distinct value.
+    frames = _get_alarm_frames(entry_data, manager)
+    frame_key = ("alarms_data", active_only, execution_mode)
+    frame = frames.get(frame_key) if limit is None else None
+    if frame is None:
+        alarms = manager.list_alarms(active_only=active_only)
+        # The summary covers every listed alarm; only the sent slice is serialized.
+        summary = _get_alarms_summary(entry_data, manager, active_only, alarms)
+        if limit is not None:
+            alarms = alarms[:limit]
+        frame = json_bytes(
+            {
+                "alarms": _serialize_alarms(hass, entry_data, manager, alarms, execution_mode),
+                "summary": summary,
+                "execution_mode": execution_mode,
+            }
+        )
+        if limit is None:
+            frames[frame_key] = frame
 
+    connection.send_message(construct_result_message(msg["id"], frame))
 
-@websocket_api.websocket_command(
-    {
-        vol.Required("type"): "smart_assist/alarm_action",
-        vol.Required("action"): vol.In(["snooze", "cancel", "delete", "status", "edit"]),
-        vol.Optional("alarm_id"): str,
-        vol.Optional("display_id"): str,
-        vol.Optional("minutes"): int,
-        vol.Optional("label"): str,
-        vol.Optional("message"): str,
-        vol.Optional("scheduled_for"): str,
-        vol.Optional("recurrence"): vol.Any(dict, None),
-        vol.Optional("tts_targets"): str,
-        vol.Optional("wake_text_dynamic"): bool,
-        vol.Optional("wake_text_include_weather"): bool,
-        vol.Optional("wake_text_include_news"): bool,
-        vol.Optional("reactivate", default=False): bool,
-    }
-)
-@websocket_api.require_admin
-@websocket_api.async_response
-async def ws_alarm_action(
+
+async def _alarm_action_status(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
+    entry: Any,
+    entry_data: dict[str, Any],
+    manager: PersistentAlarmManager,
+    alarm_ref: str | None,
+    execution_mode: str,
 ) -> None:
-    """Execute alarm management action for dashboard tab controls."""
-    entry = _get_primary_entry(hass)
-    if not entry:
-        connection.send_error(msg["id"], "not_found", "Smart Assist entry not found")
-        return
-
-    manager = _get_alarm_manager(hass, entry)
-    if manager is None:
-        connection.send_error(msg["id"], "not_found", "Persistent alarm manager unavailable")
-        return
-
-    action = msg["action"]
-    alarm_ref = msg.get("alarm_id") or msg.get("display_id")
-    execution_mode = _get_alarm_execution_mode_for_entry(hass, entry)
-
-    if action == "status":
-        if not alarm_ref:
+    """Send one alarm, or every alarm when no alarm is referenced."""
+    if not alarm_ref:
+        frames = _get_alarm_frames(entry_data, manager)
+        frame_key = ("status", execution_mode)
+        frame = frames.get(frame_key)
+        if frame is None:
             alarms = manager.list_alarms(active_only=False)
-            connection.send_result(
-                msg["id"],
+            frame = json_bytes(
                 {
                     "success": True,
                     "message": f"Alarm count: {len(alarms)}",
-                    "alarms": [_serialize_alarm(hass, {**alarm, "execution_mode": execution_mode}) for alarm in alarms],
-                },
+                    "alarms": _serialize_alarms(hass, entry_data, manager, alarms, execution_mode),
+                }
             )
-            return
-
-        alarm = manager.get_alarm(str(alarm_ref))
-        if alarm is None:
-            connection.send_error(msg["id"], "not_found", f"Alarm not found: {alarm_ref}")
-            return
-        connection.send_result(
-            msg["id"],
-            {
-                "success": True,
-                "message": "Alarm status resolved",
-                "alarm": _serialize_alarm(hass, {**alarm, "execution_mode": execution_mode}),
-            },
-        )
+            frames[frame_key] = frame
+        connection.send_message(construct_result_message(msg["id"], frame))
         return
 
-    if action == "cancel":
-        if not alarm_ref:
-            connection.send_error(msg["id"], "invalid_format", "alarm_id or display_id is required")
-            return
-        if not manager.cancel_alarm(str(alarm_ref)):
-            connection.send_error(msg["id"], "not_found", f"Alarm not found or inactive: {alarm_ref}")
-            return
-        alarm = manager.get_alarm(str(alarm_ref))
-        await manager.async_force_save()
-        if alarm is not None:
-            hass.bus.async_fire(
-                PERSISTENT_ALARM_EVENT_UPDATED,
-                {
-                    "entry_id": entry.entry_id,
-                    "alarm_id": alarm.get("id"),
-                    "display_id": alarm.get("display_id"),
-                    "status": alarm.get("status"),
-                    "active": alarm.get("active"),
-                    "scheduled_for": alarm.get("scheduled_for"),
-                    "snoozed_until": alarm.get("snoozed_until"),
-                    "updated_at": alarm.get("updated_at"),
-                    "reason": "cancel",
-                },
-            )
-        from homeassistant.helpers.dispatcher import async_dispatcher_send
-
-        async_dispatcher_send(hass, _build_alarm_update_signal_name(entry))
-        connection.send_result(
-            msg["id"],
-            {
-                "success": True,
-                "message": "Alarm cancelled",
-                "alarm": _serialize_alarm(hass, {**alarm, "execution_mode": execution_mode}) if alarm else None,
-            },
-        )
+    alarm = manager.get_alarm(str(alarm_ref))
+    if alarm is None:
+        connection.send_error(msg["id"], "not_found", f"Alarm not found: {alarm_ref}")
         return
+    connection.send_result(
+        msg["id"],
+        {
+            "success": True,
+            "message": "Alarm status resolved",
+            "alarm": _serialize_alarm(hass, alarm, execution_mode=execution_mode),
+        },
+    )
 
-    if action == "delete":
-        if not alarm_ref:
-            connection.send_error(msg["id"], "invalid_format", "alarm_id or display_id is required")
-            return
-
-        alarm_before_delete = manager.get_alarm(str(alarm_ref))
-        if not manager.delete_alarm(str(alarm_ref)):
-            connection.send_error(msg["id"], "not_found", f"Alarm not found: {alarm_ref}")
-            return
 
-        await manager.async_force_save()
-        hass.bus.async_fire(
-            PERSISTENT_ALARM_EVENT_UPDATED,
-            {
-                "entry_id": entry.entry_id,
-                "alarm_id": alarm_before_delete.get("id") if alarm_before_delete else str(alarm_ref),
-                "display_id": alarm_before_delete.get("display_id") if alarm_before_delete else None,
-                "status": "deleted",
-                "active": False,
-                "scheduled_for": None,
-                "snoozed_until": None,
-                "updated_at": alarm_before_delete.get("updated_at") if alarm_before_delete else None,
-                "reason": "delete",
-            },
-        )
+async def _alarm_action_cancel(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    entry: Any,
+    entry_data: dict[str, Any],
+    manager: PersistentAlarmManager,
+    alarm_ref: str | None,
+    execution_mode: str,
+) -> None:
+    """Cancel (dismiss) the referenced alarm."""
+    if not alarm_ref:
+        connection.send_error(msg["id"], "invalid_format", "alarm_id or display_id is required")
+        return
+    if not manager.cancel_alarm(str(alarm_ref)):
+        connection.send_error(msg["id"], "not_found", f"Alarm not found or inactive: {alarm_ref}")
+        return
+    alarm = manager.get_alarm(str(alarm_ref))
+    await _post_alarm_mutation(hass, entry, manager, alarm, "cancel")
+    connection.send_result(
+        msg["id"],
+        {
+            "success": True,
+            "message": "Alarm cancelled",
+            "alarm": _serialize_alarm(hass, alarm, execution_mode=execution_mode) if alarm else None,
+        },
+    )
 
-        from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-        async_dispatcher_send(hass, _build_alarm_update_signal_name(entry))
-        connection.send_result(
-            msg["id"],
-            {
-                "success": True,
-                "message": "Alarm deleted",
-                "deleted_alarm_id": alarm_before_delete.get("id") if alarm_before_delete else str(alarm_ref),
-            },
-        )
+async def _alarm_action_delete(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    entry: Any,
+    entry_data: dict[str, Any],
+    manager: PersistentAlarmManager,
+    alarm_ref: str | None,
+    execution_mode: str,
+) -> None:
+    """Delete the referenced alarm permanently."""
+    if not alarm_ref:
+        connection.send_error(msg["id"], "invalid_format", "alarm_id or display_id is required")
         return
 
-    if action == "edit":
-        if not alarm_ref:
-            connection.send_error(msg["id"], "invalid_format", "alarm_id or display_id is required")
-            return
+    alarm_before_delete = manager.get_alarm(str(alarm_ref)) or {}
+    deleted_alarm_id = alarm_before_delete.get("id") or str(alarm_ref)
+    if not manager.delete_alarm(str(alarm_ref)):
+        connection.send_error(msg["id"], "not_found", f"Alarm not found: {alarm_ref}")
+        return
 
-        updates: dict[str, Any] = {}
-        if "label" in msg:
-            updates["label"] = msg.get("label")
-        if "message" in msg:
-            updates["message"] = msg.get("message")
-        if "scheduled_for" in msg:
-            updates["scheduled_for"] = msg.get("scheduled_for")
-        if "recurrence" in msg:
-            updates["recurrence"] = msg.get("recurrence")
-        delivery_updates: dict[str, Any] = {}
-        if "tts_targets" in msg:
-            raw_targets = str(msg.get("tts_targets") or "")
-            parsed_targets = [
-                token.strip().lower()
-                for token in raw_targets.split(",")
-                if token.strip().lower().startswith("media_player.")
-            ]
-            delivery_updates["tts_targets"] = parsed_targets
-        wake_text_updates: dict[str, Any] = {}
-        if "wake_text_dynamic" in msg:
-            wake_text_updates["dynamic"] = bool(msg.get("wake_text_dynamic"))
-        if "wake_text_include_weather" in msg:
-            wake_text_updates["include_weather"] = bool(msg.get("wake_text_include_weather"))
-        if "wake_text_include_news" in msg:
-            wake_text_updates["include_news"] = bool(msg.get("wake_text_include_news"))
-        if wake_text_updates:
-            delivery_updates["wake_text"] = wake_text_updates
-        if delivery_updates:
-            updates["delivery"] = delivery_updates
-
-        alarm, status = manager.update_alarm(
-            str(alarm_ref),
-            updates,
-            reactivate=bool(msg.get("reactivate", False)),
-        )
-        if alarm is None:
-            connection.send_error(msg["id"], "invalid_format", status)
-            return
+    await _post_alarm_mutation(
+        hass,
+        entry,
+        manager,
+        {
+            "id": deleted_alarm_id,
+            "display_id": alarm_before_delete.get("display_id"),
+            "status": "deleted",
+            "active": False,
+            "updated_at": alarm_before_delete.get("updated_at"),
+        },
+        "delete",
+    )
+    connection.send_result(
+        msg["id"],
+        {
+            "success": True,
+            "message": "Alarm deleted",
+            "deleted_alarm_id": deleted_alarm_id,
+        },
+    )
 
-        await manager.async_force_save()
 
-        hass.bus.async_fire(
-            PERSISTENT_ALARM_EVENT_UPDATED,
-            {
-                "entry_id": entry.entry_id,
-                "alarm_id": alarm.get("id"),
-                "display_id": alarm.get("display_id"),
-                "status": alarm.get("status"),
-                "active": alarm.get("active"),
-                "scheduled_for": alarm.get("scheduled_for"),
-                "snoozed_until": alarm.get("snoozed_until"),
-                "updated_at": alarm.get("updated_at"),
-                "reason": "edit",
-            },
-        )
-        from homeassistant.helpers.dispatcher import async_dispatcher_send
+async def _alarm_action_edit(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    entry: Any,
+    entry_data: dict[str, Any],
+    manager: PersistentAlarmManager,
+    alarm_ref: str | None,
+    execution_mode: str,
+) -> None:
+    """Apply dashboard edits to the referenced alarm."""
+    if not alarm_ref:
+        connection.send_error(msg["id"], "invalid_format", "alarm_id or display_id is required")
+        return
 
-        async_dispatcher_send(hass, _build_alarm_update_signal_name(entry))
-        connection.send_result(
-            msg["id"],
-            {
-                "success": True,
-                "message": "Alarm updated",
-                "alarm": _serialize_alarm(hass, {**alarm, "execution_mode": execution_mode}),
-            },
+    updates: dict[str, Any] = {}
+    if "label" in msg:
+        updates["label"] = msg.get("label")
+    if "message" in msg:
+        updates["message"] = msg.get("message")
+    if "scheduled_for" in msg:
+        updates["scheduled_for"] = msg.get("scheduled_for")
+    if "recurrence" in msg:
+        updates["recurrence"] = msg.get("recurrence")
+    delivery_updates: dict[str, Any] = {}
+    if "tts_targets" in msg:
+        delivery_updates["tts_targets"] = list(
+            _parse_tts_targets(str(msg.get("tts_targets") or ""))
         )
+    wake_text_updates: dict[str, Any] = {}
+    if "wake_text_dynamic" in msg:
+        wake_text_updates["dynamic"] = bool(msg.get("wake_text_dynamic"))
+    if "wake_text_include_weather" in msg:
+        wake_text_updates["include_weather"] = bool(msg.get("wake_text_include_weather"))
+    if "wake_text_include_news" in msg:
+        wake_text_updates["include_news"] = bool(msg.get("wake_text_include_news"))
+    if wake_text_updates:
+        delivery_updates["wake_text"] = wake_text_updates
+    if delivery_updates:
+        updates["delivery"] = delivery_updates
+
+    alarm, status = manager.update_alarm(
+        str(alarm_ref),
+        updates,
+        reactivate=bool(msg.get("reactivate", False)),
+    )
+    if alarm is None:
+        connection.send_error(msg["id"], "invalid_format", status)
         return
 
+    await _post_alarm_mutation(hass, entry, manager, alarm, "edit")
+    connection.send_result(
+        msg["id"],
+        {
+            "success": True,
+            "message": "Alarm updated",
+            "alarm": _serialize_alarm(hass, alarm, execution_mode=execution_mode),
+        },
+    )
+
+
+async def _alarm_action_snooze(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    entry: Any,
+    entry_data: dict[str, Any],
+    manager: PersistentAlarmManager,
+    alarm_ref: str | None,
+    execution_mode: str,
+) -> None:
+    """Snooze the referenced alarm, or the single recently fired one."""
     minutes = int(msg.get("minutes") or 0)
     if minutes <= 0:
         connection.send_error(msg["id"], "invalid_format", "minutes must be > 0 for snooze")
@@ -1194,40 +1665,81 @@ async def ws_alarm_action(
         connection.send_error(msg["id"], "not_found", status)
         return
 
-    await manager.async_force_save()
-    hass.bus.async_fire(
-        PERSISTENT_ALARM_EVENT_UPDATED,
-        {
-            "entry_id": entry.entry_id,
-            "alarm_id": alarm.get("id"),
-            "display_id": alarm.get("display_id"),
-            "status": alarm.get("status"),
-            "active": alarm.get("active"),
-            "scheduled_for": alarm.get("scheduled_for"),
-            "snoozed_until": alarm.get("snoozed_until"),
-            "updated_at": alarm.get("updated_at"),
-            "reason": "snooze",
-        },
-    )
-    from homeassistant.helpers.dispatcher import async_dispatcher_send
-
-    async_dispatcher_send(hass, _build_alarm_update_signal_name(entry))
+    await _post_alarm_mutation(hass, entry, manager, alarm, "snooze")
     connection.send_result(
         msg["id"],
         {
             "success": True,
             "message": "Alarm snoozed",
-            "alarm": _serialize_alarm(hass, {**alarm, "execution_mode": execution_mode}),
+            "alarm": _serialize_alarm(hass, alarm, execution_mode=execution_mode),
         },
     )
 
 
+_ALARM_ACTION_HANDLERS: dict[str, Callable[..., Awaitable[None]]] = {
+    "status": _alarm_action_status,
+    "cancel": _alarm_action_cancel,
+    "delete": _alarm_action_delete,
+    "edit": _alarm_action_edit,
+    "snooze": _alarm_action_snooze,
+}
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "smart_assist/alarm_action",
+        vol.Required("action"): vol.In(list(_ALARM_ACTION_HANDLERS)),
+        vol.Optional("alarm_id"): str,
+        vol.Optional("display_id"): str,
+        vol.Optional("minutes"): int,
+        vol.Optional("label"): str,
+        vol.Optional("message"): str,
+        vol.Optional("scheduled_for"): str,
+        vol.Optional("recurrence"): vol.Any(dict, None),
+        vol.Optional("tts_targets"): str,
+        vol.Optional("wake_text_dynamic"): bool,
+        vol.Optional("wake_text_include_weather"): bool,
+        vol.Optional("wake_text_include_news"): bool,
+        vol.Optional("reactivate", default=False): bool,
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def ws_alarm_action(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Execute alarm management action for dashboard tab controls."""
+    entry = _get_primary_entry(hass)
+    if not entry:
+        connection.send_error(msg["id"], "not_found", "Smart Assist entry not found")
+        return
+
+    entry_data = _get_entry_data(hass, entry)
+    manager = _get_alarm_manager(entry_data)
+    if manager is None:
+        connection.send_error(msg["id"], "not_found", "Persistent alarm manager unavailable")
+        return
+
+    await _ALARM_ACTION_HANDLERS[msg["action"]](
+        hass,
+        connection,
+        msg,
+        entry,
+        entry_data,
+        manager,
+        msg.get("alarm_id") or msg.get("display_id"),
+        _get_alarm_execution_mode_for_entry(hass, entry),
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "smart_assist/request_history",
-        vol.Optional("agent_id"): str,
-        vol.Optional("limit", default=50): int,
-        vol.Optional("offset", default=0): int,
+        **_OPT_AGENT_SCHEMA,
+        vol.Optional("limit", default=50): vol.All(int, vol.Range(min=1)),
+        vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
     }
 )
 @websocket_api.require_admin
@@ -1247,12 +1759,8 @@ async def ws_request_history(
     if not store:
         return
 
-    agent_id = msg.get("agent_id")
-    limit = msg.get("limit", 50)
-    offset = msg.get("offset", 0)
-
     history_entries, total = store.get_entries(
-        limit=limit, offset=offset, agent_id=agent_id
+        limit=msg["limit"], offset=msg["offset"], agent_id=msg.get("agent_id")
     )
     connection.send_result(msg["id"], {
         "entries": history_entries,
@@ -1263,7 +1771,7 @@ async def ws_request_history(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "smart_assist/tool_analytics",
-        vol.Optional("agent_id"): str,
+        **_OPT_AGENT_SCHEMA,
     }
 )
 @websocket_api.require_admin
@@ -1296,7 +1804,7 @@ async def ws_tool_analytics(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "smart_assist/system_prompt",
-        vol.Optional("agent_id"): str,
+        **_OPT_AGENT_SCHEMA,
     }
 )
 @websocket_api.require_admin
@@ -1327,8 +1835,7 @@ async def ws_system_prompt(
     user_prompt = ""
 
     if entity:
-        # Import and call build_system_prompt (will use cache if available)
-        from .prompt_builder import build_system_prompt
+        # build_system_prompt uses the entity's cached prompt if available
         try:
             system_prompt = await build_system_prompt(entity)
         except Exception as err:
@@ -1350,7 +1857,7 @@ async def ws_system_prompt(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "smart_assist/request_history_clear",
-        vol.Optional("agent_id"): str,
+        **_OPT_AGENT_SCHEMA,
     }
 )
 @websocket_api.require_admin
@@ -1372,5 +1879,9 @@ async def ws_request_history_clear(
 
     agent_id = msg.get("agent_id")
     removed = store.clear(agent_id=agent_id)
+    # The cached snapshot still carries the cleared history summaries.
+    entry = _get_primary_entry(hass)
+    if entry:
+        _invalidate_dashboard_snapshot(_get_entry_data(hass, entry))
     await store.async_force_save()
     connection.send_result(msg["id"], {"removed": removed})
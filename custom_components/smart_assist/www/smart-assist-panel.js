@@ -225,15 +225,10 @@ class SmartAssistPanel extends HTMLElement {
           try {
             this._lastSubscriptionUpdate = Date.now();
             this._subscriptionHealthy = true;
-            if (data && data.update_type === "alarms") {
-              this._data = Object.assign(this._data || {}, {
-                alarms_summary: data.alarms_summary || {},
-              });
-              if (this._activeTab === "alarms") {
-                this._loadAlarms(true);
-              }
+            if (data && data.update_type === "batch") {
+              (data.updates || []).forEach((update) => this._applySubscriptionUpdate(update));
             } else {
-              this._data = Object.assign(this._data || {}, data);
+              this._applySubscriptionUpdate(data);
             }
             this._scheduleRender();
           } catch (err) {
@@ -251,6 +246,26 @@ class SmartAssistPanel extends HTMLElement {
     }
   }
 
+  _applySubscriptionUpdate(data) {
+    if (data && data.update_type === "alarms") {
+      this._data = Object.assign(this._data || {}, {
+        alarms_summary: data.alarms_summary || {},
+      });
+      if (this._activeTab === "alarms") {
+        this._loadAlarms(true);
+      }
+    } else if (data && data.update_type === "delta") {
+      const current = this._data || {};
+      this._data = Object.assign(current, {
+        agents: Object.assign(current.agents || {}, data.agents || {}),
+        tasks: Object.assign(current.tasks || {}, data.tasks || {}),
+        memory: data.memory || current.memory || {},
+      });
+    } else {
+      this._data = Object.assign(this._data || {}, data);
+    }
+  }
+
   async _resubscribe() {
     if (this._unsub) {
       try { this._unsub(); } catch (_) {}
@@ -0,0 +1,101 @@
+"""Tests for coalesced memory persistence."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from homeassistant.core import HomeAssistant
+
+# Add custom_components to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+from custom_components.smart_assist.context.memory import MemoryManager  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    yield hass
+    await hass.async_stop(force=True)
+
+
+def _memory_manager(hass: HomeAssistant) -> MemoryManager:
+    manager = MemoryManager(hass)
+    manager._store.async_save = AsyncMock()
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_force_saves_within_window_share_one_write(hass) -> None:
+    manager = _memory_manager(hass)
+
+    await asyncio.gather(*(manager.async_force_save() for _ in range(5)))
+
+    manager._store.async_save.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_force_save_releases_every_waiter(hass) -> None:
+    manager = _memory_manager(hass)
+
+    waiters = [hass.async_create_task(manager.async_force_save()) for _ in range(3)]
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=2)
+
+    assert all(waiter.done() and waiter.exception() is None for waiter in waiters)
+    assert manager._pending_force_save is None
+    assert manager._pending_force_save_handle is None
+
+    # A later call opens a new window and writes again.
+    await manager.async_force_save()
+    assert manager._store.async_save.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_pending_coalesced_save(hass) -> None:
+    manager = _memory_manager(hass)
+    manager._force_save_window_seconds = 60
+
+    waiter = hass.async_create_task(manager.async_force_save())
+    await asyncio.sleep(0)
+    assert manager._pending_force_save is not None
+    manager._store.async_save.assert_not_awaited()
+
+    await manager.async_shutdown()
+    await asyncio.wait_for(waiter, timeout=2)
+
+    manager._store.async_save.assert_awaited_once()
+    assert manager._pending_force_save is None
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_running_coalesced_save(hass) -> None:
+    manager = _memory_manager(hass)
+    manager._force_save_window_seconds = 0
+    release = asyncio.Event()
+
+    async def _slow_save(data) -> None:
+        await release.wait()
+
+    manager._store.async_save.side_effect = _slow_save
+    manager._mark_dirty()
+
+    waiter = hass.async_create_task(manager.async_force_save())
+    # The window elapsed and the shared save is still writing.
+    while manager._store.async_save.await_count == 0:
+        await asyncio.sleep(0)
+    assert manager._pending_force_save_handle is None
+
+    shutdown = hass.async_create_task(manager.async_shutdown())
+    await asyncio.sleep(0)
+    assert not shutdown.done()
+    release.set()
+    await asyncio.wait_for(asyncio.gather(waiter, shutdown), timeout=2)
+
+    manager._store.async_save.assert_awaited_once()
+    assert manager._pending_force_save_task is None
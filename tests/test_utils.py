@@ -0,0 +1,66 @@
+"""Tests for TTS text cleanup."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+# Add custom_components to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+from custom_components.smart_assist.utils import clean_for_tts  # noqa: E402
+
+
+def test_status_tag_between_newlines_takes_surrounding_whitespace() -> None:
+    # The newlines around the tag go with it, so the following "- " is no
+    # longer at a line start and is not stripped as a bullet.
+    assert clean_for_tts("Done.\n[No action needed]\n- Next step") == "Done. - Next step"
+    assert (
+        clean_for_tts("Licht ist an.\n\n[Keine weitere Aktion noetig]\n\nSonst noch was?", "de")
+        == "Licht ist an. Sonst noch was?"
+    )
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        # A tag runs from the first "[" after the previous "]" to the next "]".
+        ("[[action]] ok", "] ok"),
+        ("See [[note] [action needed]] now", "See [[note] ] now"),
+        ("Keep [a [b] c] and [x [action] y]", "Keep [a [b] c] and y]"),
+        ("[[[[[Hi", "[[[[[Hi"),
+    ],
+)
+def test_status_tags_with_nested_brackets(text: str, expected: str) -> None:
+    assert clean_for_tts(text) == expected
+
+
+def test_status_tags_on_unbalanced_brackets() -> None:
+    text = "[" * 20000 + "action"
+    assert clean_for_tts(text) == text
+    assert clean_for_tts("[action" * 5000 + "] done") == "done"
+
+
+@pytest.mark.parametrize(
+    ("text", "language", "expected"),
+    [
+        # Multi-character symbols win over their single-character prefixes.
+        ("a>=b", "", "a greater than or equal to b"),
+        (
+            "It is 21°C and 50% >= 3 < 4 & 5°F",
+            "en",
+            "It is 21 degrees Celsius and 50 percent greater than or equal to 3 "
+            "less than 4 and 5 degrees Fahrenheit",
+        ),
+        (
+            "Es sind 21°C, 50% und >= 3",
+            "de",
+            "Es sind 21 Grad Celsius, 50 Prozent und groesser oder gleich 3",
+        ),
+    ],
+)
+def test_symbols_are_spoken_in_one_pass(text: str, language: str, expected: str) -> None:
+    assert clean_for_tts(text, language) == expected
@@ -0,0 +1,529 @@
+"""Tests for dashboard websocket caching and invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+# Add custom_components to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+from custom_components.smart_assist import websocket as ws  # noqa: E402
+from custom_components.smart_assist.const import (  # noqa: E402
+    CONF_CALENDAR_CONTEXT,
+    DOMAIN,
+)
+from custom_components.smart_assist.context.persistent_alarms import (  # noqa: E402
+    PersistentAlarmManager,
+)
+from custom_components.smart_assist.context.request_history import (  # noqa: E402
+    RequestHistoryEntry,
+    RequestHistoryStore,
+)
+from custom_components.smart_assist.llm.base_client import LLMMetrics  # noqa: E402
+
+
+class _FakeSubentry:
+    def __init__(self, subentry_id: str, subentry_type: str = "conversation") -> None:
+        self.subentry_id = subentry_id
+        self.subentry_type = subentry_type
+        self.title = subentry_id
+        self.data: dict = {}
+
+
+class _FakeEntry:
+    def __init__(self, *subentry_ids: str) -> None:
+        self.entry_id = "entry_1"
+        self.subentries = {
+            subentry_id: _FakeSubentry(subentry_id) for subentry_id in subentry_ids
+        }
+        self.options: dict = {}
+        self.data: dict = {}
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+        self.subscriptions: dict = {}
+
+    def send_result(self, msg_id, result=None) -> None:
+        self.messages.append(
+            {"id": msg_id, "type": "result", "success": True, "result": result}
+        )
+
+    def send_message(self, message) -> None:
+        self.messages.append(json.loads(message) if isinstance(message, bytes) else message)
+
+    def send_error(self, msg_id, code, message) -> None:
+        self.messages.append({"id": msg_id, "type": "result", "success": False})
+
+
+def _handler(command):
+    """Return the undecorated coroutine behind a websocket command."""
+    while hasattr(command, "__wrapped__"):
+        command = command.__wrapped__
+    return command
+
+
+def _setup_entry(hass: HomeAssistant, *subentry_ids: str) -> tuple[_FakeEntry, dict]:
+    """Register a config entry with one LLM client per subentry."""
+    entry = _FakeEntry(*subentry_ids)
+    hass.config_entries = SimpleNamespace(
+        async_entries=lambda domain: [entry],
+        async_get_entry=lambda entry_id: entry if entry_id == entry.entry_id else None,
+    )
+    entry_data = {
+        "agents": {
+            subentry_id: {"llm_client": SimpleNamespace(metrics=LLMMetrics())}
+            for subentry_id in subentry_ids
+        },
+        "tasks": {},
+    }
+    hass.data[DOMAIN] = {entry.entry_id: entry_data}
+    return entry, entry_data
+
+
+async def _dashboard_data(hass: HomeAssistant) -> dict:
+    connection = _FakeConnection()
+    await _handler(ws.ws_dashboard_data)(
+        hass, connection, {"id": 1, "type": "smart_assist/dashboard_data"}
+    )
+    return connection.messages[-1]["result"]
+
+
+def _history_entry(agent_id: str) -> RequestHistoryEntry:
+    return RequestHistoryEntry(
+        id=RequestHistoryStore.generate_id(),
+        timestamp="2026-01-01T00:00:00+00:00",
+        agent_id=agent_id,
+        agent_name=agent_id,
+        conversation_id=None,
+        user_id="default",
+        input_text="hi",
+        response_text="hello",
+        prompt_tokens=10,
+        completion_tokens=5,
+        cached_tokens=0,
+        response_time_ms=100.0,
+        llm_provider="openrouter",
+        model="test",
+        llm_iterations=1,
+    )
+
+
+def _alarm_manager(hass: HomeAssistant, count: int) -> PersistentAlarmManager:
+    manager = PersistentAlarmManager(hass)
+    manager.async_force_save = AsyncMock()
+    for day in range(1, count + 1):
+        manager.create_alarm(f"2030-01-{day:02d}T07:00:00+00:00", label=f"Alarm {day}")
+    return manager
+
+
+async def _alarms_data(hass: HomeAssistant, **options) -> dict:
+    connection = _FakeConnection()
+    await _handler(ws.ws_alarms_data)(
+        hass, connection, {"id": 1, "type": "smart_assist/alarms_data", **options}
+    )
+    return connection.messages[-1]["result"]
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest.mark.asyncio
+async def test_history_clear_refreshes_dashboard_history_summary(hass) -> None:
+    entry, entry_data = _setup_entry(hass, "agent_1")
+    store = RequestHistoryStore(hass)
+    store.async_force_save = AsyncMock()
+    store.add_entry(_history_entry("agent_1"))
+    entry_data["request_history"] = store
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+
+    first = await _dashboard_data(hass)
+    assert first["agents"]["agent_1"]["history_summary"]["total_requests"] == 1
+
+    connection = _FakeConnection()
+    await _handler(ws.ws_request_history_clear)(
+        hass, connection, {"id": 2, "type": "smart_assist/request_history_clear"}
+    )
+    assert connection.messages[-1]["result"] == {"removed": 1}
+
+    second = await _dashboard_data(hass)
+    assert second["agents"]["agent_1"]["history_summary"]["total_requests"] == 0
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_dashboard_data_cancels_calendar_fetch_when_snapshot_fails(
+    hass, monkeypatch
+) -> None:
+    _setup_entry(hass, "agent_1")
+    calendar_tasks = []
+    create_task = hass.async_create_task
+
+    def _capture_task(target, *args, **kwargs):
+        task = create_task(target, *args, **kwargs)
+        calendar_tasks.append(task)
+        return task
+
+    async def _snapshot(hass, entry):
+        raise RuntimeError("snapshot failed")
+
+    async def _slow_calendar(hass, entry):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(hass, "async_create_task", _capture_task)
+    monkeypatch.setattr(ws, "_get_cached_dashboard_snapshot", _snapshot)
+    monkeypatch.setattr(ws, "_get_cached_calendar_data", _slow_calendar)
+
+    with pytest.raises(RuntimeError):
+        await _dashboard_data(hass)
+    await asyncio.sleep(0)
+    assert len(calendar_tasks) == 1
+    assert calendar_tasks[0].cancelled()
+
+
+
+@pytest.mark.asyncio
+async def test_cancelled_calendar_build_cancels_calendar_fetches(hass, monkeypatch) -> None:
+    entry, entry_data = _setup_entry(hass, "agent_1")
+    entry.subentries["agent_1"].data[CONF_CALENDAR_CONTEXT] = True
+    hass.states.async_set("calendar.work", "off")
+    hass.states.async_set("calendar.home", "off")
+    fetch_started = asyncio.Event()
+
+    async def _get_events(hass, start, end):
+        fetch_started.set()
+        await asyncio.sleep(10)
+
+    calendar_entity = SimpleNamespace(async_get_events=_get_events)
+    hass.data["calendar"] = SimpleNamespace(get_entity=lambda _: calendar_entity)
+    fetch_tasks = []
+    create_task = hass.async_create_task
+
+    def _capture_task(target, *args, **kwargs):
+        task = create_task(target, *args, **kwargs)
+        fetch_tasks.append(task)
+        return task
+
+    monkeypatch.setattr(hass, "async_create_task", _capture_task)
+    build = asyncio.ensure_future(ws._build_calendar_data(hass, entry_data, entry))
+    await fetch_started.wait()
+    build.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await build
+    await asyncio.sleep(0)
+
+    assert len(fetch_tasks) == 2
+    assert all(task.cancelled() for task in fetch_tasks)
+
+@pytest.mark.asyncio
+async def test_alarms_data_limit_does_not_grow_frame_cache(hass) -> None:
+    _, entry_data = _setup_entry(hass, "agent_1")
+    entry_data["persistent_alarm_manager"] = _alarm_manager(hass, 5)
+
+    full = await _alarms_data(hass)
+    for limit in range(1, 8):
+        limited = await _alarms_data(hass, limit=limit)
+        assert limited["alarms"] == full["alarms"][:limit]
+        assert limited["summary"] == full["summary"]
+
+    assert len(full["alarms"]) == 5
+    assert len(entry_data["_alarm_frames"][1]) == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_stay_fresh_without_a_signal(hass) -> None:
+    entry, entry_data = _setup_entry(hass, "agent_1")
+    entry.subentries["task_1"] = _FakeSubentry("task_1", "ai_task")
+    entry_data["tasks"]["task_1"] = {"llm_client": SimpleNamespace(metrics=LLMMetrics())}
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+
+    result = await _dashboard_data(hass)
+    assert result["agents"]["agent_1"]["metrics"]["total_requests"] == 0
+    assert result["tasks"]["task_1"]["metrics"]["total_requests"] == 0
+
+    # Cancelled requests and alarm announcements record metrics without a signal.
+    entry_data["agents"]["agent_1"]["llm_client"].metrics.total_requests = 3
+    entry_data["tasks"]["task_1"]["llm_client"].metrics.total_requests = 2
+    # Only the short-lived snapshot may hide them; the cached payloads must not.
+    ws._invalidate_dashboard_snapshot(entry_data)
+
+    result = await _dashboard_data(hass)
+    assert result["agents"]["agent_1"]["metrics"]["total_requests"] == 3
+    assert result["tasks"]["task_1"]["metrics"]["total_requests"] == 2
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_cache_warming_signal_refreshes_cached_dashboard(hass) -> None:
+    entry, entry_data = _setup_entry(hass, "agent_1")
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+
+    assert (await _dashboard_data(hass))["agents"]["agent_1"]["cache_warming"] is None
+    entry_data["cache_warming"] = {"agent_1": {"status": "active", "warmup_count": 2}}
+
+    async_dispatcher_send(hass, f"{DOMAIN}_cache_warming_updated_agent_1")
+    result = await _dashboard_data(hass)
+    assert result["agents"]["agent_1"]["cache_warming"]["warmup_count"] == 2
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_entry_reload_serves_fresh_dashboard(hass) -> None:
+    entry, entry_data = _setup_entry(hass, "agent_1")
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+    assert (await _dashboard_data(hass))["agents"]["agent_1"]["metrics"]["total_requests"] == 0
+    unsub()
+
+    # An options update reloads the entry, which replaces its entry data.
+    reloaded_metrics = LLMMetrics(total_requests=7)
+    hass.data[DOMAIN][entry.entry_id] = {
+        "agents": {"agent_1": {"llm_client": SimpleNamespace(metrics=reloaded_metrics)}},
+        "tasks": {},
+    }
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+    assert (await _dashboard_data(hass))["agents"]["agent_1"]["metrics"]["total_requests"] == 7
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_alarm_signal_refreshes_cached_dashboard(hass) -> None:
+    entry, entry_data = _setup_entry(hass, "agent_1")
+    manager = _alarm_manager(hass, 1)
+    entry_data["persistent_alarm_manager"] = manager
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+
+    assert (await _dashboard_data(hass))["alarms_summary"]["total"] == 1
+    manager.create_alarm("2030-02-01T07:00:00+00:00", label="Later")
+
+    async_dispatcher_send(hass, f"{DOMAIN}_alarms_updated_{entry.entry_id}")
+    assert (await _dashboard_data(hass))["alarms_summary"]["total"] == 2
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_entity_registry_update_drops_serialized_alarms(hass) -> None:
+    entry, entry_data = _setup_entry(hass, "agent_1")
+    entry_data["persistent_alarm_manager"] = _alarm_manager(hass, 2)
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+
+    first = await _alarms_data(hass)
+    assert "_alarm_frames" in entry_data
+    assert "_serialized_alarms" in entry_data
+
+    hass.bus.async_fire(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        {"action": "create", "entity_id": "media_player.kitchen"},
+    )
+    await hass.async_block_till_done()
+    assert "_alarm_frames" not in entry_data
+    assert "_serialized_alarms" not in entry_data
+
+    assert await _alarms_data(hass) == first
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_serialized_alarm_cache_is_keyed_by_id_update_and_mode(hass) -> None:
+    _, entry_data = _setup_entry(hass, "agent_1")
+    manager = _alarm_manager(hass, 2)
+    first, second = manager.list_alarms(active_only=False)
+
+    payloads = ws._serialize_alarms(hass, entry_data, manager, [first, second], "direct")
+    _, cache = entry_data["_serialized_alarms"]
+    assert set(cache) == {first["id"], second["id"]}
+    assert cache[first["id"]][0] == (first["updated_at"], "direct")
+
+    manager.cancel_alarm(first["id"])
+    alarms = manager.list_alarms(active_only=False)
+    updated = {
+        payload["id"]: payload
+        for payload in ws._serialize_alarms(hass, entry_data, manager, alarms, "direct")
+    }
+    # Only the mutated alarm is serialized again.
+    assert updated[second["id"]] is payloads[1]
+    assert updated[first["id"]] is not payloads[0]
+    assert updated[first["id"]]["status"] == "dismissed"
+
+    other_mode = ws._serialize_alarms(hass, entry_data, manager, alarms, "script")
+    assert all(payload["execution_mode"] == "script" for payload in other_mode)
+
+
+
+@pytest.mark.asyncio
+async def test_serialized_alarm_cache_evicts_deleted_alarms(hass) -> None:
+    _, entry_data = _setup_entry(hass, "agent_1")
+    manager = _alarm_manager(hass, 3)
+    alarms = manager.list_alarms(active_only=False)
+    ws._serialize_alarms(hass, entry_data, manager, alarms, "direct")
+    kept = alarms[0]
+
+    # Deleted outside the websocket API, e.g. by the LLM alarm tool.
+    for alarm in alarms[1:]:
+        assert manager.delete_alarm(alarm["id"])
+    # A limited listing serializes only a slice but still prunes against the store.
+    ws._serialize_alarms(hass, entry_data, manager, [], "direct")
+
+    revision, cache = entry_data["_serialized_alarms"]
+    assert revision == manager.revision
+    assert set(cache) == {kept["id"]}
+
+async def _subscribe(hass: HomeAssistant, monkeypatch) -> _FakeConnection:
+    monkeypatch.setattr(ws, "_SUBSCRIBE_DEBOUNCE_SECONDS", 0.01)
+    connection = _FakeConnection()
+    await _handler(ws.ws_subscribe)(
+        hass, connection, {"id": 5, "type": "smart_assist/subscribe"}
+    )
+    return connection
+
+
+async def _pushed_events(connection: _FakeConnection) -> list[dict]:
+    await asyncio.sleep(0.05)
+    return [message["event"] for message in connection.messages if message["type"] == "event"]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_coalesces_signal_burst_into_one_flush(hass, monkeypatch) -> None:
+    entry, _ = _setup_entry(hass, "agent_1")
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+    connection = await _subscribe(hass, monkeypatch)
+
+    for _ in range(20):
+        async_dispatcher_send(hass, f"{DOMAIN}_metrics_updated_agent_1")
+
+    events = await _pushed_events(connection)
+    assert [event["update_type"] for event in events] == ["delta"]
+    connection.subscriptions[5]()
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_cancels_pending_flush(hass, monkeypatch) -> None:
+    entry, _ = _setup_entry(hass, "agent_1")
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+    connection = await _subscribe(hass, monkeypatch)
+
+    async_dispatcher_send(hass, f"{DOMAIN}_metrics_updated_agent_1")
+    connection.subscriptions[5]()
+
+    assert await _pushed_events(connection) == []
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_delta_carries_only_changed_subentries(hass, monkeypatch) -> None:
+    entry, _ = _setup_entry(hass, "agent_1", "agent_2")
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+    connection = await _subscribe(hass, monkeypatch)
+
+    async_dispatcher_send(hass, f"{DOMAIN}_metrics_updated_agent_2")
+
+    (event,) = await _pushed_events(connection)
+    assert list(event["agents"]) == ["agent_2"]
+    assert event["tasks"] == {}
+    connection.subscriptions[5]()
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_batches_updates_from_one_window(hass, monkeypatch) -> None:
+    entry, entry_data = _setup_entry(hass, "agent_1")
+    entry_data["persistent_alarm_manager"] = _alarm_manager(hass, 1)
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+    connection = await _subscribe(hass, monkeypatch)
+
+    async_dispatcher_send(hass, f"{DOMAIN}_metrics_updated_agent_1")
+    async_dispatcher_send(hass, f"{DOMAIN}_alarms_updated_{entry.entry_id}")
+
+    (batch,) = await _pushed_events(connection)
+    assert batch["update_type"] == "batch"
+    assert [update["update_type"] for update in batch["updates"]] == ["delta", "alarms"]
+    connection.subscriptions[5]()
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_splits_oversized_batches(hass, monkeypatch) -> None:
+    entry, entry_data = _setup_entry(hass, "agent_1")
+    entry_data["persistent_alarm_manager"] = _alarm_manager(hass, 1)
+    unsub = ws.async_track_dashboard_updates(hass, entry)
+    connection = await _subscribe(hass, monkeypatch)
+    monkeypatch.setattr(ws, "_MAX_WS_MESSAGE_BYTES", 10)
+
+    async_dispatcher_send(hass, f"{DOMAIN}_metrics_updated_agent_1")
+    async_dispatcher_send(hass, f"{DOMAIN}_alarms_updated_{entry.entry_id}")
+
+    events = await _pushed_events(connection)
+    assert [event["update_type"] for event in events] == ["delta", "alarms"]
+    connection.subscriptions[5]()
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_skips_alarm_push_for_unchanged_revision(hass, monkeypatch) -> None:
+    entry, entry_data = _setup_entry(hass, "agent_1")
+    manager = _alarm_manager(hass, 1)
+    entry_data["persistent_alarm_manager"] = manager
+    connection = await _subscribe(hass, monkeypatch)
+    alarm_signal = f"{DOMAIN}_alarms_updated_{entry.entry_id}"
+
+    async_dispatcher_send(hass, alarm_signal)
+    assert len(await _pushed_events(connection)) == 1
+
+    async_dispatcher_send(hass, alarm_signal)
+    assert len(await _pushed_events(connection)) == 1
+
+    manager.create_alarm("2030-02-01T07:00:00+00:00", label="Later")
+    async_dispatcher_send(hass, alarm_signal)
+    events = await _pushed_events(connection)
+    assert len(events) == 2
+    assert events[-1]["alarms_summary"]["total"] == 2
+    connection.subscriptions[5]()
+
+
+@pytest.mark.asyncio
+async def test_request_history_pages_newest_first_at_both_ends(hass) -> None:
+    _, entry_data = _setup_entry(hass, "agent_1", "agent_2")
+    store = RequestHistoryStore(hass)
+    for index in range(5):
+        entry = _history_entry("agent_1" if index % 2 == 0 else "agent_2")
+        entry.input_text = f"request {index}"
+        store.add_entry(entry)
+    entry_data["request_history"] = store
+
+    async def _page(**options) -> tuple[list[str], int]:
+        connection = _FakeConnection()
+        await _handler(ws.ws_request_history)(
+            hass,
+            connection,
+            {"id": 1, "type": "smart_assist/request_history", "limit": 50, "offset": 0, **options},
+        )
+        result = connection.messages[-1]["result"]
+        return [item["input_text"] for item in result["entries"]], result["total"]
+
+    assert await _page(limit=2) == (["request 4", "request 3"], 5)
+    assert await _page(limit=2, offset=2) == (["request 2", "request 1"], 5)
+    assert await _page(limit=5, offset=3) == (["request 1", "request 0"], 5)
+    assert await _page(limit=1, offset=4) == (["request 0"], 5)
+    assert await _page(limit=3, offset=5) == ([], 5)
+    assert await _page(limit=50, offset=0, agent_id="agent_1") == (
+        ["request 4", "request 2", "request 0"],
+        3,
+    )
+    assert await _page(limit=1, offset=2, agent_id="agent_1") == (["request 0"], 3)